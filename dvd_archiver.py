@@ -2,23 +2,52 @@
 import json
 import os
 import re
-import shlex
+import select
 import signal
 import subprocess
 import sys
+import threading
 import time
 import platform
+import plistlib
 import argparse
+import functools
+import ctypes
+from io import StringIO
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List, Callable
 from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import shutil
 import hashlib
+import mmap
+import tempfile
+from contextlib import ExitStack, nullcontext
 
+try:
+    import fcntl  # Unix only; used for F_NOCACHE on macOS
+except ImportError:
+    fcntl = None
+
+try:
+    import ssl  # Absent on Python builds without OpenSSL; only read for its version string
+except ImportError:
+    ssl = None
+
+try:
+    import orjson  # Optional: much faster JSON encode/decode for the archive database
+except ImportError:
+    orjson = None
+
+try:
+    import xxhash  # Optional: fast content fingerprint for spotting re-rips of archived discs
+except ImportError:
+    xxhash = None
 
-# External tools expected: drutil, diskutil, ddrescue, shasum, dvdisaster (optional)
+
+# External tools expected: drutil, diskutil, ddrescue, dvdisaster (optional)
 # This script orchestrates per-disc archival with a Rich-based TUI.
 
 try:
@@ -27,6 +56,7 @@ try:
     from rich.table import Table
     from rich.text import Text
     from rich.live import Live
+    from rich.markup import escape
     from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn, TransferSpeedColumn
     from rich.prompt import Prompt, Confirm
     from dotenv import load_dotenv
@@ -50,9 +80,7 @@ if IS_WINDOWS:
             sys.stderr.reconfigure(encoding='utf-8', errors='replace')
 
         # Enable ANSI escape codes on Windows 10+ (VT100 terminal mode)
-        import ctypes
         import msvcrt
-        import os
 
         # Check if stdout is a real console (not redirected)
         if os.isatty(sys.stdout.fileno()):
@@ -80,6 +108,12 @@ load_dotenv()
 USE_COLORS_ON_WINDOWS = False
 
 
+# Windows plain-text output: markup regex and one reusable render-to-string console
+_RE_RICH_MARKUP = re.compile(r"\[/?[^\]]+\]")
+_PLAIN_BUFFER = StringIO()
+_PLAIN_CONSOLE: Optional[Console] = None
+
+
 def safe_print(text, markup: bool = True, **kwargs):
     """Print text, using plain text on Windows, Rich on other platforms
 
@@ -90,23 +124,23 @@ def safe_print(text, markup: bool = True, **kwargs):
     """
     if IS_WINDOWS:
         # On Windows, strip all Rich markup and use plain text
-        import re
-        from io import StringIO
+        global _PLAIN_CONSOLE
 
         # Handle Rich objects (Panel, Text, etc.) by rendering to plain text
         if not isinstance(text, str):
             try:
-                from rich.console import Console as TempConsole
-                temp_buffer = StringIO()
-                temp_console = TempConsole(file=temp_buffer, force_terminal=False, legacy_windows=False, no_color=True, width=80)
-                temp_console.print(text)
-                clean_text = temp_buffer.getvalue().strip()
+                if _PLAIN_CONSOLE is None:
+                    _PLAIN_CONSOLE = Console(file=_PLAIN_BUFFER, force_terminal=False, legacy_windows=False, no_color=True, width=80)
+                _PLAIN_BUFFER.seek(0)
+                _PLAIN_BUFFER.truncate(0)
+                _PLAIN_CONSOLE.print(text)
+                clean_text = _PLAIN_BUFFER.getvalue().strip()
             except Exception:
                 # Fallback: convert to string
                 clean_text = str(text)
         else:
-            # Strip Rich markup from strings
-            clean_text = re.sub(r'\[/?[^\]]+\]', '', text)
+            # Strip Rich markup from strings (most progress lines have none)
+            clean_text = _RE_RICH_MARKUP.sub('', text) if '[' in text else text
 
         print(clean_text, flush=True)
     else:
@@ -143,6 +177,52 @@ class StepState:
     message: str = ""
 
 
+# Step table styling and row order (shared by every render)
+STATUS_STYLE = {
+    "pending": "grey50",
+    "running": "yellow",
+    "done": "green",
+    "error": "red",
+    "skipped": "blue",
+}
+STATUS_MARK = {
+    "pending": "[ ]",
+    "running": "[~]",
+    "done": "[x]",
+    "error": "[!]",
+    "skipped": "[-]",
+}
+# Rendered "Status" cell per status, so a redraw only looks it up. The marks are escaped:
+# unescaped, Rich reads "[x]" as a markup tag and drops it
+STATUS_CELL = {status: f"[{STATUS_STYLE[status]}]{escape(STATUS_MARK[status])} {status}[/]" for status in STATUS_STYLE}
+IMAGING_STEP_ORDER = ["detect", "unmount", "ddrescue_fast", "ddrescue_retry", "checksum", "parity", "eject"]
+COPY_STEP_ORDER = ["validate", "copy", "checksum", "parity"]
+
+
+class StepTable:
+    """Live renderable for a step table
+
+    Rows are built from `steps` only when Rich actually draws the table, so callers
+    can mutate step state freely and just call live.refresh() instead of rebuilding
+    a Table on every progress tick.
+    """
+
+    def __init__(self, title: str, steps: Dict[str, "StepState"], order: List[str]):
+        self.title = title
+        self.steps = steps
+        self.order = order
+
+    def __rich__(self) -> Table:
+        t = Table(title=self.title)
+        t.add_column("Step")
+        t.add_column("Status")
+        t.add_column("Message")
+        for key in self.order:
+            s = self.steps[key]
+            t.add_row(s.name, STATUS_CELL[s.status], s.message)
+        return t
+
+
 @dataclass
 class DiscArchive:
     disc_number: str
@@ -157,6 +237,7 @@ class DiscArchive:
     ddrescue_stats: Dict[str, str]
     steps: Dict[str, StepState]
     success: bool = False
+    fingerprint_xxh3: Optional[str] = None  # xxh3_128 of the ISO, if xxhash is installed
 
 
 @dataclass
@@ -177,33 +258,136 @@ ARCHIVE_BASE = os.getenv("DVD_ARCHIVE_BASE", str(Path.home() / "DVD_Archive"))
 # Normalize base path to absolute path (expand ~ and env vars)
 ARCHIVE_BASE = os.path.abspath(os.path.expanduser(os.path.expandvars(ARCHIVE_BASE)))
 DVD_MODE = os.getenv("DVD_MODE", "ddrescue").strip().lower()
+# Run the ddrescue retry pass even when the fast pass left no bad areas
+DVD_FORCE_RETRY = os.getenv("DVD_FORCE_RETRY", "").strip() == "1"
+# The archive database and copy state are machine-read; only indent them on request
+DVD_PRETTY_JSON = os.getenv("DVD_PRETTY_JSON", "").strip() == "1"
 ARCHIVE_DIR = Path(ARCHIVE_BASE)
 ARCHIVE_DIR.mkdir(parents=True, exist_ok=True)
-JSON_ARCHIVE = ARCHIVE_DIR / "archive_log.json"
+JSON_ARCHIVE = ARCHIVE_DIR / "archive_log.json"  # Compacted snapshot
+ARCHIVE_LOG = ARCHIVE_DIR / "archive_log.ndjson"  # Per-disc entries appended since the last snapshot
+ARCHIVE_COMPACT_EVERY = 50  # Fold the append log into the snapshot after this many entries
 
 # Copy mode configuration
 SOURCE_PATHS = os.getenv("SOURCE_PATHS", "").strip()
 TARGET_PATH = os.getenv("TARGET_PATH", "").strip()
 COPY_STATE_JSON = Path("copy_state.json")  # Store in project folder
+MAX_RETRIES = 5  # Failed attempts before a folder is skipped and listed as needing attention
+
+# Progress speed is averaged over this many seconds of size samples
+SPEED_WINDOW_SECONDS = 5.0
+
+# Raw device / image I/O size; macOS throughput plateaus at 256 KiB-1 MiB requests
+IMAGE_BLOCK_SIZE = 1024 * 1024
+# Supported formats: ISO, IMG, CDR (macOS), MDF/MDS (Alcohol 120%), MDX (Media Data eXtended), NRG (Nero), BIN/CUE
+IMAGE_EXTENSIONS = frozenset({"iso", "img", "cdr", "mdf", "mdx", "nrg", "bin"})
+FICLONE = 0x40049409  # Linux ioctl: reflink dst to src (Btrfs, XFS)
+# Read size for streaming SHA-256 (a whole number of I/O blocks, small enough to stay in cache)
+SHA256_CHUNK_SIZE = 4 * IMAGE_BLOCK_SIZE
+# Background hashers per folder: two sequential streams keep an SSD's queue busy,
+# more only make the files compete for the same bandwidth
+HASH_WORKERS = 2
+# Where madvise exists, hash straight out of the page cache instead of copying each block
+# into a buffer. Not on macOS, where reads go through F_NOCACHE to keep the cache clean.
+MMAP_HASHING = hasattr(mmap, "MADV_SEQUENTIAL") and not IS_MACOS
+# Concurrent dvdisaster runs per folder when the target's media type is unknown: every
+# run reads its whole image, so more than two mostly wait on the same disk or share
+PARITY_WORKERS = 2
+# Concurrent deletions when clearing temp folders and --start-from targets
+REMOVE_WORKERS = 4
+
+# Patterns for parsing drutil/diskutil/ddrescue/hdiutil output, compiled once
+_RE_DRUTIL_NAME = re.compile(r"Name:\s*(/dev/disk\d+)")
+_RE_DISKUTIL_SIZE = re.compile(r"\*(\d+\.\d+|\d+)\s+GB")
+_RE_TOTAL_BYTES = re.compile(r"Total Size:\s+.*\((\d+) Bytes\)")
+_RE_DRUTIL_SPACE_USED = re.compile(r"Space Used:.*?blocks:\s*(\d+)")
+_RE_DRUTIL_BLOCKS = re.compile(r"blocks\s*:\s*(\d+)\s*/")
+_RE_VOLUME_NAME = re.compile(r"^\s*Volume Name:(.*)$", re.M)
+_RE_MEDIA_NAME = re.compile(r"^\s*Media Name:(.*)$", re.M)
+_RE_HDIUTIL_PCT = re.compile(r"PERCENT:\s*([0-9.]+)")
+_RE_DISC_NUMBER = re.compile(r"(\d{3,})")
+_RE_LINE_BREAK = re.compile(rb"[\r\n]")
+_RE_DIGITS = re.compile(r"\d+")
+_RE_DISC_SUFFIX = re.compile(r"_(\d+)$|disc(\d+)$", re.IGNORECASE)
+_RE_DISC_SUFFIX_STRIP = re.compile(r"[_-]?\d+$|disc\d+$", re.IGNORECASE)
+_RE_LEADING_NUMBER = re.compile(r"^\d+[\s\-_.]*")
+_RE_UNDERSCORE_RUN = re.compile(r"_+")
+_RE_DDRESCUE_LINE = re.compile(
+    r"pct rescued:\s*(?P<pct>[0-9.]+)%|"
+    r"rescued:\s*(?P<resc_val>[0-9.]+)\s*(?P<resc_unit>kB|MB|GB).*?current rate:\s*(?P<rate_val>[0-9.]+)\s*(?P<rate_unit>kB|MB|GB)/s.*?average rate:\s*(?P<avg_val>[0-9.]+)\s*(?P<avg_unit>kB|MB|GB)/s",
+    re.IGNORECASE,
+)
+
+
+def json_dumps_bytes(data, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def json_loads(raw):
+    """Parse JSON from bytes or str, using orjson when installed"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 def load_archive_json() -> Dict:
+    """Load the archive database: the compacted snapshot plus any appended entries
+
+    Later entries for the same disc number override earlier ones.
+    """
+    data: Dict = {}
     if JSON_ARCHIVE.exists():
-        with open(JSON_ARCHIVE, "r") as f:
+        with open(JSON_ARCHIVE, "rb") as f:
             try:
-                return json.load(f)
+                data = json_loads(f.read())
             except Exception:
-                return {}
-    return {}
+                data = {}
+    if ARCHIVE_LOG.exists():
+        with open(ARCHIVE_LOG, "rb") as f:
+            for line in f:
+                try:
+                    data.update(json_loads(line))
+                except ValueError:
+                    # Torn final line from an interrupted append
+                    continue
+    return data
 
 
 def save_archive_json(data: Dict) -> None:
     tmp = JSON_ARCHIVE.with_suffix(".tmp")
-    with open(tmp, "w") as f:
-        json.dump(data, f, indent=2)
+    with open(tmp, "wb") as f:
+        f.write(json_dumps_bytes(data, indent=DVD_PRETTY_JSON))
     tmp.replace(JSON_ARCHIVE)
 
 
+def append_archive_entry(disc_number: str, entry: Dict) -> None:
+    """Record one disc in the archive database without rewriting the whole file"""
+    record = json_dumps_bytes({disc_number: entry}) + b"\n"
+    with open(ARCHIVE_LOG, "a+b") as f:
+        # After a crash mid-append the last line has no newline; start a fresh line so
+        # this record is not glued onto the torn one and skipped with it on load
+        end = f.seek(0, os.SEEK_END)
+        if end:
+            f.seek(end - 1)
+            if f.read(1) != b"\n":
+                record = b"\n" + record
+        f.write(record)
+        f.flush()
+        os.fsync(f.fileno())
+    # The log never holds more than ARCHIVE_COMPACT_EVERY lines, so counting them is cheap
+    with open(ARCHIVE_LOG, "r") as f:
+        pending = sum(1 for _ in f)
+    if pending >= ARCHIVE_COMPACT_EVERY:
+        # Snapshot first; replaying the log over it again after a crash is harmless
+        save_archive_json(load_archive_json())
+        ARCHIVE_LOG.unlink()
+
+
 def load_copy_state() -> Dict:
     """Load copy mode state from JSON
 
@@ -211,9 +395,9 @@ def load_copy_state() -> Dict:
     for consistency with actual usage.
     """
     if COPY_STATE_JSON.exists():
-        with open(COPY_STATE_JSON, "r") as f:
+        with open(COPY_STATE_JSON, "rb") as f:
             try:
-                data = json.load(f)
+                data = json_loads(f.read())
 
                 # Migrate old format to new format if needed
                 if "processed_folders" in data or "processed_discs" in data:
@@ -261,63 +445,144 @@ def load_copy_state() -> Dict:
     }
 
 
-def save_copy_state(data: Dict) -> None:
-    """Save copy mode state to JSON with atomic write"""
+def save_copy_state(data: Dict, sync: bool = False) -> None:
+    """Save copy mode state to JSON with atomic write
+
+    The rename alone keeps readers from ever seeing a half-written file; sync=True also
+    fsyncs the data first so the new state survives a power loss.
+    """
     data["last_updated"] = datetime.now(timezone.utc).isoformat()
     tmp = COPY_STATE_JSON.with_suffix(".tmp")
-    with open(tmp, "w") as f:
-        json.dump(data, f, indent=2)
+    persisted = {k: v for k, v in data.items() if k != "_norm_index"}
+    with open(tmp, "wb") as f:
+        f.write(json_dumps_bytes(persisted, indent=DVD_PRETTY_JSON))
+        if sync:
+            f.flush()
+            os.fsync(f.fileno())
     tmp.replace(COPY_STATE_JSON)
 
 
+class StateWriter:
+    """Coalesce save_copy_state() calls for a copy-mode run
+
+    The whole state is re-serialized on every save, so writes are batched: the file is
+    rewritten once `every` changes have piled up or `interval` seconds have passed.
+    Only every `sync_every`-th save is fsynced. Call flush(sync=True) before exiting so
+    the last changes reach the disk.
+    """
+
+    def __init__(self, state: Dict, every: int = 5, interval: float = 10.0, sync_every: int = 10):
+        self.state = state
+        self.every = every
+        self.interval = interval
+        self.sync_every = sync_every
+        self._pending = 0
+        self._saves_since_sync = 0
+        self._last_flush = time.monotonic()
+
+    def mark_dirty(self) -> None:
+        self._pending += 1
+        if self._pending >= self.every or time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+
+    def flush(self, sync: bool = False) -> None:
+        if self._pending:
+            self._saves_since_sync += 1
+            sync = sync or self._saves_since_sync >= self.sync_every
+            save_copy_state(self.state, sync=sync)
+            if sync:
+                self._saves_since_sync = 0
+            self._pending = 0
+        elif sync and self._saves_since_sync:
+            # Nothing new, but earlier saves were never fsynced: write it once more, durably
+            save_copy_state(self.state, sync=True)
+            self._saves_since_sync = 0
+        self._last_flush = time.monotonic()
+
+
+def reset_copy_state(state: Dict) -> None:
+    """Empty an in-memory copy state in place; the caller saves it"""
+    for key in ("processed_files", "folder_metadata", "path_statistics"):
+        state.setdefault(key, {}).clear()
+    _invalidate_normalized_index(state)
+
+
+def normalize_filename(filename: str) -> str:
+    """Lowercase a filename and strip leading zeros from its numeric parts for matching"""
+    stem, dot, ext = filename.rpartition(".")
+    if not dot or not stem:
+        # No suffix (or a dotfile), like Path.stem/Path.suffix
+        stem, ext = filename, ""
+    else:
+        ext = "." + ext
+    return normalize_stem(stem) + ext.lower()
+
+
+def normalize_stem(stem: str) -> str:
+    """Lowercase a name and strip leading zeros from its numeric parts ("Disc 01" -> "disc 1")"""
+    return _RE_DIGITS.sub(lambda m: m.group(0).lstrip("0") or "0", stem.lower())
+
+
+def _normalized_index(state: Dict) -> Dict[str, List[str]]:
+    """Map normalized filename -> processed_files keys, built once and kept on the state
+
+    The "_norm_index" key is never saved by save_copy_state. mark_disc_completed keeps it
+    up to date; deletions drop it via _invalidate_normalized_index and it is rebuilt lazily.
+    """
+    index = state.get("_norm_index")
+    if index is None:
+        index = {}
+        for existing_filename in state.get("processed_files", {}):
+            index.setdefault(normalize_filename(existing_filename), []).append(existing_filename)
+        state["_norm_index"] = index
+    return index
+
+
+def _invalidate_normalized_index(state: Dict) -> None:
+    state.pop("_norm_index", None)
+
+
 def is_disc_completed(state: Dict, target_filename: str, source_path: str = None) -> bool:
     """Check if a disc has been successfully processed
 
     Uses normalized matching to handle leading zeros (e.g., 675.cdr matches 0675.cdr)
     Also verifies the target file actually exists on disk and source matches
     """
-    import re
-
-    def normalize_filename(filename: str) -> str:
-        """Strip leading zeros from numeric parts for matching"""
-        stem = Path(filename).stem
-        ext = Path(filename).suffix
-        def strip_leading_zeros(match):
-            num = match.group(0).lstrip('0')
-            return num if num else '0'
-        normalized_stem = re.sub(r'\d+', strip_leading_zeros, stem.lower())
-        return normalized_stem + ext.lower()
+    processed = state.get("processed_files", {})
+    source_name = normalize_filename(Path(source_path).name) if source_path else None
+
+    def completed(disc_data: Dict) -> Optional[bool]:
+        """True/False if this entry decides the lookup, None to keep looking"""
+        if not disc_data.get("all_steps_completed", False):
+            return None
+        # Verify the file actually exists on disk (one stat, no Path object)
+        target_path = disc_data.get("target_path")
+        if not target_path:
+            return None
+        try:
+            os.stat(target_path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        # If source_path provided, verify it matches the stored source
+        # Normalize both paths for comparison (handle MDX vs ISO)
+        if source_name is not None:
+            stored_source = disc_data.get("source_path", "")
+            if source_name != normalize_filename(Path(stored_source).name):
+                return False  # Different source file
+        return True
 
     # Check exact match first
-    disc_data = state.get("processed_files", {}).get(target_filename)
-    if disc_data and disc_data.get("all_steps_completed", False):
-        # Verify the file actually exists on disk
-        target_path = disc_data.get("target_path")
-        if target_path and Path(target_path).exists():
-            # If source_path provided, verify it matches the stored source
-            if source_path:
-                stored_source = disc_data.get("source_path", "")
-                # Normalize both paths for comparison (handle MDX vs ISO)
-                if normalize_filename(Path(source_path).name) != normalize_filename(Path(stored_source).name):
-                    return False  # Different source file
-            return True
+    disc_data = processed.get(target_filename)
+    if disc_data:
+        decided = completed(disc_data)
+        if decided is not None:
+            return decided
 
     # Check normalized match
-    normalized_target = normalize_filename(target_filename)
-    for existing_filename in state.get("processed_files", {}).keys():
-        if normalize_filename(existing_filename) == normalized_target:
-            disc_data = state["processed_files"][existing_filename]
-            if disc_data.get("all_steps_completed", False):
-                # Verify the file actually exists on disk
-                target_path = disc_data.get("target_path")
-                if target_path and Path(target_path).exists():
-                    # If source_path provided, verify it matches the stored source
-                    if source_path:
-                        stored_source = disc_data.get("source_path", "")
-                        # Normalize both paths for comparison (handle MDX vs ISO)
-                        if normalize_filename(Path(source_path).name) != normalize_filename(Path(stored_source).name):
-                            return False  # Different source file
-                    return True
+    for existing_filename in _normalized_index(state).get(normalize_filename(target_filename), ()):
+        decided = completed(processed[existing_filename])
+        if decided is not None:
+            return decided
 
     return False
 
@@ -331,6 +596,9 @@ def mark_disc_completed(state: Dict, target_filename: str, source_path: str, tar
     """
     if "processed_files" not in state:
         state["processed_files"] = {}
+    index = state.get("_norm_index")
+    if index is not None and target_filename not in state["processed_files"]:
+        index.setdefault(normalize_filename(target_filename), []).append(target_filename)
 
     # Overwrite existing entry (if any) with new values
     state["processed_files"][target_filename] = {
@@ -433,34 +701,50 @@ def clear_folder_state(state: Dict, folder_number: str):
 
     for key in keys_to_remove:
         del state["processed_files"][key]
+    _invalidate_normalized_index(state)
+
 
+def run_cmd(cmd: List[str], check: bool = False, capture: bool = True, env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None) -> Tuple[int, str, str]:
+    """Run an argv list directly (no /bin/sh in between) and return (rc, stdout, stderr)
 
-def run_cmd(cmd: str, check: bool = False, capture: bool = True, env: Optional[Dict[str, str]] = None, cwd: Optional[str] = None) -> Tuple[int, str, str]:
-    proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env, cwd=cwd)
-    out, err = proc.communicate()
+    Output is captured as bytes and decoded once, skipping the universal-newlines
+    text wrapper; tool output is small and (almost always) ASCII.
+    """
+    try:
+        proc = subprocess.run(cmd, capture_output=True, env=env, cwd=cwd)
+    except OSError as e:
+        # Missing executable: report it like the shell would instead of raising
+        if check:
+            raise
+        return 127, "", str(e)
+    out = proc.stdout.decode("utf-8", "replace")
+    err = proc.stderr.decode("utf-8", "replace")
     if check and proc.returncode != 0:
         raise subprocess.CalledProcessError(proc.returncode, cmd, output=out, stderr=err)
     return proc.returncode, out, err
 
 
+@functools.lru_cache(maxsize=1)
+def drutil_status() -> Tuple[int, str]:
+    """Return (returncode, stdout) of `drutil status`; one disc per run, so query it once"""
+    rc, out, _ = run_cmd(["drutil", "status"])
+    return rc, out
+
+
 def detect_dvd_device() -> Tuple[Optional[str], Optional[str]]:
     # Prefer drutil status, which typically reports the exact device name
-    _, dout, _ = run_cmd("drutil status")
-    dvd_disk: Optional[str] = None
-    for line in dout.splitlines():
-        if "Name:" in line and "/dev/disk" in line:
-            # e.g. "Name: /dev/disk4"
-            dvd_disk = line.split("Name:")[-1].strip()
-            break
+    _, dout = drutil_status()
+    # e.g. "Name: /dev/disk4"
+    m = _RE_DRUTIL_NAME.search(dout)
+    dvd_disk: Optional[str] = m.group(1) if m else None
 
     # Validate via diskutil list to ensure it exists and is external physical
-    if dvd_disk:
-        rc, lout, _ = run_cmd("diskutil list")
-        if dvd_disk in lout:
-            return dvd_disk, dvd_disk.replace("/dev/disk", "/dev/rdisk")
+    # (one listing serves both the check and the fallback scan below)
+    rc, lout, _ = run_cmd(["diskutil", "list"])
+    if dvd_disk and dvd_disk in lout:
+        return dvd_disk, dvd_disk.replace("/dev/disk", "/dev/rdisk")
 
     # Fallback: look for external, physical disk with ~4–9 GB capacity (typical DVD)
-    rc, lout, _ = run_cmd("diskutil list")
     candidates: List[str] = []
     current_header = ""
     for line in lout.splitlines():
@@ -468,7 +752,7 @@ def detect_dvd_device() -> Tuple[Optional[str], Optional[str]]:
             current_header = line.split()[0].strip(":")
         elif current_header and (" *" in line or "\t*" in line or "*" in line):
             # size line; try to parse size in GB
-            m = re.search(r"\*(\d+\.\d+|\d+)\s+GB", line)
+            m = _RE_DISKUTIL_SIZE.search(line)
             if m:
                 size_gb = float(m.group(1))
                 if 3.5 <= size_gb <= 9.5:
@@ -481,33 +765,54 @@ def detect_dvd_device() -> Tuple[Optional[str], Optional[str]]:
 
 
 def unmount_disk(disk: str) -> bool:
-    rc, out, err = run_cmd(f"diskutil unmountDisk {shlex.quote(disk)}")
+    rc, out, err = run_cmd(["diskutil", "unmountDisk", disk])
     return rc == 0
 
 
+@functools.lru_cache(maxsize=4)
+def diskutil_info(disk: str) -> Optional[Dict]:
+    """Return `diskutil info -plist` for a disk, fetched once per run
+
+    Returns None if the plist could not be obtained or parsed.
+    """
+    rc, out, _ = run_cmd(["diskutil", "info", "-plist", disk])
+    if rc != 0:
+        return None
+    try:
+        return plistlib.loads(out.encode("utf-8"))
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=4)
 def get_total_bytes_for_device(rdisk: str) -> int:
     # Try diskutil info for the whole disk
     disk = rdisk.replace("/dev/rdisk", "/dev/disk")
-    rc, out, _ = run_cmd(f"diskutil info {shlex.quote(disk)}")
-    if rc == 0:
-        # Total Size:               7.5 GB (7498065920 Bytes)
-        m = re.search(r"Total Size:\s+.*\((\d+) Bytes\)", out)
-        if m:
-            try:
-                return int(m.group(1))
-            except Exception:
-                pass
+    info = diskutil_info(disk)
+    if info is not None:
+        if isinstance(info.get("TotalSize"), int) and info["TotalSize"] > 0:
+            return info["TotalSize"]
+    else:
+        rc, out, _ = run_cmd(["diskutil", "info", disk])
+        if rc == 0:
+            # Total Size:               7.5 GB (7498065920 Bytes)
+            m = _RE_TOTAL_BYTES.search(out)
+            if m:
+                try:
+                    return int(m.group(1))
+                except Exception:
+                    pass
     # Fallback to drutil status parsing of Space Used blocks (DVD 2048-byte sectors)
-    rc2, dstat, _ = run_cmd("drutil status")
+    rc2, dstat = drutil_status()
     if rc2 == 0:
-        m2 = re.search(r"Space Used:.*?blocks:\s*(\d+)", dstat)
+        m2 = _RE_DRUTIL_SPACE_USED.search(dstat)
         if m2:
             try:
                 return int(m2.group(1)) * 2048
             except Exception:
                 pass
         # Another drutil format sometimes shows just blocks count before sizes
-        m3 = re.search(r"blocks\s*:\s*(\d+)\s*/", dstat)
+        m3 = _RE_DRUTIL_BLOCKS.search(dstat)
         if m3:
             try:
                 return int(m3.group(1)) * 2048
@@ -516,38 +821,68 @@ def get_total_bytes_for_device(rdisk: str) -> int:
     return 0
 
 
+def list_volume_names(disk: str) -> Optional[List[str]]:
+    """Return the volume names on a disk from one `diskutil list -plist` call
+
+    Returns None if the plist could not be obtained or parsed.
+    """
+    rc, out, _ = run_cmd(["diskutil", "list", "-plist", disk])
+    if rc != 0:
+        return None
+    try:
+        info = plistlib.loads(out.encode("utf-8"))
+    except Exception:
+        return None
+    names: List[str] = []
+    for entry in info.get("AllDisksAndPartitions", []):
+        for part in entry.get("Partitions", []):
+            if part.get("VolumeName"):
+                names.append(part["VolumeName"])
+        # Optical discs without a partition map carry the volume on the whole disk
+        if entry.get("VolumeName"):
+            names.append(entry["VolumeName"])
+    return names
+
+
 def get_disc_label(disk: str) -> Optional[str]:
     # Prefer the actual volume (partition) name if mounted
-    rc, out, _ = run_cmd(f"diskutil list {shlex.quote(disk)}")
-    if rc == 0:
-        part_ids: List[str] = []
-        for line in out.splitlines():
-            m = re.search(rf"^{re.escape(disk)}s(\d+)", line.strip())
-            if m:
-                part_ids.append(f"{disk}s{m.group(1)}")
-        for pid in part_ids:
-            rc2, info, _ = run_cmd(f"diskutil info {shlex.quote(pid)}")
-            if rc2 == 0:
-                vol = None
-                for ln in info.splitlines():
-                    if "Volume Name:" in ln:
-                        vol = ln.split(":", 1)[1].strip()
-                        break
-                if vol:
-                    return vol
+    volume_names = list_volume_names(disk)
+    if volume_names:
+        return volume_names[0]
+    if volume_names is None:
+        # Legacy text parsing, only if the plist was unavailable
+        rc, out, _ = run_cmd(["diskutil", "list", disk])
+        if rc == 0:
+            part_ids: List[str] = []
+            part_re = re.compile(rf"^{re.escape(disk)}s(\d+)")
+            for line in out.splitlines():
+                m = part_re.search(line.strip())
+                if m:
+                    part_ids.append(f"{disk}s{m.group(1)}")
+            for pid in part_ids:
+                rc2, info, _ = run_cmd(["diskutil", "info", pid])
+                if rc2 == 0:
+                    m = _RE_VOLUME_NAME.search(info)
+                    vol = m.group(1).strip() if m else None
+                    if vol:
+                        return vol
     # Fallback to disk info, but avoid using drive model; try Media Name only if nothing else
-    rc3, out3, _ = run_cmd(f"diskutil info {shlex.quote(disk)}")
-    if rc3 == 0:
-        for line in out3.splitlines():
-            if "Volume Name:" in line:
-                name = line.split(":", 1)[1].strip()
-                if name:
-                    return name
-        for line in out3.splitlines():
-            if "Media Name:" in line:
-                name = line.split(":", 1)[1].strip()
-                if name and not name.upper().startswith("HL-DT-ST"):
-                    return name
+    info = diskutil_info(disk)
+    if info is not None:
+        volume_name = (info.get("VolumeName") or "").strip()
+        media_name = (info.get("MediaName") or "").strip()
+    else:
+        volume_name = media_name = ""
+        rc3, out3, _ = run_cmd(["diskutil", "info", disk])
+        if rc3 == 0:
+            m = _RE_VOLUME_NAME.search(out3)
+            volume_name = m.group(1).strip() if m else ""
+            m = _RE_MEDIA_NAME.search(out3)
+            media_name = m.group(1).strip() if m else ""
+    if volume_name:
+        return volume_name
+    if media_name and not media_name.upper().startswith("HL-DT-ST"):
+        return media_name
     # Last resort: look at /Volumes
     try:
         vols = os.listdir("/Volumes")
@@ -560,10 +895,213 @@ def get_disc_label(disk: str) -> Optional[str]:
 
 def ensure_sudo_cached() -> None:
     # Try non-interactive sudo cache; if it fails, prompt interactively
-    rc, _, _ = run_cmd("sudo -n -v")
+    rc, _, _ = run_cmd(["sudo", "-n", "-v"])
     if rc != 0:
         safe_print("[yellow]Requesting sudo to cache credentials...[/yellow]")
-        subprocess.call("sudo -v", shell=True)
+        subprocess.call(["sudo", "-v"])
+
+
+def read_ddrescue_map(log_path: Path) -> List[Tuple[int, int, str]]:
+    """Return the (pos, size, status) blocks of a ddrescue mapfile
+
+    Parsing stops at the first malformed line, which is how a mapfile that ddrescue is
+    in the middle of rewriting looks.
+    """
+    try:
+        text = log_path.read_text()
+    except OSError:
+        return []
+    blocks: List[Tuple[int, int, str]] = []
+    seen_status_line = False
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if not seen_status_line:
+            # First data line is "current_pos current_status [current_pass]"
+            seen_status_line = True
+            continue
+        parts = line.split()
+        if len(parts) < 3:
+            break
+        try:
+            blocks.append((int(parts[0], 0), int(parts[1], 0), parts[2]))
+        except ValueError:
+            break
+    return blocks
+
+
+def ddrescue_rescued_prefix(log_path: Path) -> int:
+    """Return the length of the contiguous finished ('+') area at the start of a ddrescue mapfile
+
+    Finished blocks are never rewritten by ddrescue, so bytes below this offset are final.
+    """
+    end = 0
+    for pos, size, status in read_ddrescue_map(log_path):
+        if pos != end or status != "+":
+            break
+        end = pos + size
+    return end
+
+
+def follow_and_hash(iso_path: Path, log_path: Path, done: threading.Event, result: Future) -> None:
+    """Hash iso_path while ddrescue is still writing it
+
+    Only bytes inside the finished prefix of the mapfile are hashed, so sectors that are
+    rescued out of order never end up in the digest as zeros. Once `done` is set the
+    mapfile is final; if the finished prefix covers the whole image the (sha256, xxh3)
+    digests are set on `result`, otherwise ("", "") is set and the caller should rehash.
+    """
+    digest = ImageDigest()
+    hashed = 0
+    f = None
+    try:
+        view = memoryview(bytearray(SHA256_CHUNK_SIZE))
+        while True:
+            # Check before reading the mapfile so the last iteration sees the final map
+            finished = done.is_set()
+            limit = ddrescue_rescued_prefix(log_path)
+            if f is None and iso_path.exists():
+                f = open(iso_path, "rb", buffering=0)
+            if f is not None:
+                while hashed < limit:
+                    n = f.readinto(view[:min(SHA256_CHUNK_SIZE, limit - hashed)])
+                    if not n:
+                        break
+                    digest.update(view[:n])
+                    hashed += n
+            if finished:
+                break
+            done.wait(0.5)
+        size = iso_path.stat().st_size if iso_path.exists() else 0
+        result.set_result(digest.hexdigests() if size > 0 and hashed == size else ("", ""))
+    except Exception:
+        result.set_result(("", ""))
+    finally:
+        if f is not None:
+            f.close()
+
+
+def windowed_mb_per_s(samples: deque, now: float, size: int) -> float:
+    """Record a (time, size) sample and return the MB/s over the last SPEED_WINDOW_SECONDS
+
+    Samples older than the window are dropped from the left, so the oldest remaining
+    sample is the anchor and each call is amortized O(1).
+    """
+    samples.append((now, size))
+    while len(samples) > 1 and now - samples[0][0] > SPEED_WINDOW_SECONDS:
+        samples.popleft()
+    if len(samples) < 2:
+        return 0.0
+    t0, s0 = samples[0]
+    dt = max(0.001, now - t0)
+    return (max(0, size - s0) / dt) / (1024.0 * 1024.0)
+
+
+def read_available_lines(fd: int, pending: bytearray) -> List[str]:
+    """Drain a non-blocking pipe and return the complete lines read so far
+
+    ddrescue redraws its status with carriage returns, so both \\r and \\n end a line.
+    An incomplete trailing fragment is kept in `pending` for the next call.
+    """
+    while True:
+        try:
+            chunk = os.read(fd, 65536)
+        except BlockingIOError:
+            break
+        if not chunk:
+            break
+        pending += chunk
+    parts = _RE_LINE_BREAK.split(pending)
+    pending[:] = parts[-1]
+    return [text for text in (p.decode(errors="replace").strip() for p in parts[:-1]) if text]
+
+
+class ImageGrowthWatcher:
+    """Wait until an image file grows or the writing process exits
+
+    On macOS this blocks in kqueue (VNODE extend/write on the image, PROC exit on the
+    child) instead of waking up on a fixed timer. Elsewhere, or if registration fails,
+    wait() just sleeps for the timeout and reports growth so callers keep polling.
+    """
+
+    # Recompute speed at least this often so a stalled drive shows the rate dropping
+    MAX_STALE_SECONDS = 2.0
+    # ...and at most this often, however many write events arrive in between
+    MIN_WAKE_SECONDS = 0.25
+
+    def __init__(self, path: Path, pid: int):
+        self.path = path
+        self.kq = None
+        self.fd: Optional[int] = None
+        self.last_growth = time.time()
+        if not hasattr(select, "kqueue"):
+            return
+        try:
+            self.kq = select.kqueue()
+            self.kq.control([select.kevent(
+                pid, filter=select.KQ_FILTER_PROC,
+                flags=select.KQ_EV_ADD | select.KQ_EV_ONESHOT, fflags=select.KQ_NOTE_EXIT,
+            )], 0, 0)
+        except OSError:
+            self.close()
+
+    def _register_file(self) -> List:
+        # ddrescue creates the image after it starts, so register lazily
+        if self.fd is not None or not self.path.exists():
+            return []
+        try:
+            self.fd = os.open(self.path, os.O_RDONLY)
+        except OSError:
+            return []
+        return [select.kevent(
+            self.fd, filter=select.KQ_FILTER_VNODE,
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,
+            fflags=select.KQ_NOTE_EXTEND | select.KQ_NOTE_WRITE,
+        )]
+
+    def wait(self, timeout: float) -> bool:
+        """Block up to timeout; return True if the file should be re-stat'ed"""
+        if self.kq is None:
+            time.sleep(timeout)
+            return True
+        deadline = time.time() + timeout
+        grew = False
+        while True:
+            now = time.time()
+            remaining = deadline - now
+            if grew:
+                # Trim/scrape passes write 2 KiB sectors one at a time: keep draining
+                # their events until MIN_WAKE_SECONDS have passed since the last wake-up
+                remaining = min(remaining, self.last_growth + self.MIN_WAKE_SECONDS - now)
+            if remaining <= 0:
+                break
+            try:
+                events = self.kq.control(self._register_file(), 4, remaining)
+            except OSError:
+                self.close()
+                time.sleep(max(0.0, deadline - time.time()))
+                return True
+            if not events:
+                break
+            if any(ev.filter == select.KQ_FILTER_PROC for ev in events):
+                # The writer exited: report it without waiting out the interval
+                self.last_growth = time.time()
+                return True
+            grew = True
+        now = time.time()
+        if grew or self.fd is None or now - self.last_growth >= self.MAX_STALE_SECONDS:
+            self.last_growth = now
+            return True
+        return False
+
+    def close(self) -> None:
+        if self.kq is not None:
+            self.kq.close()
+            self.kq = None
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
 
 
 def ddrescue_fast_then_retry(
@@ -572,19 +1110,24 @@ def ddrescue_fast_then_retry(
     log_path: Path,
     refresh_cb: Optional[Callable[[], None]],
     steps: Dict[str, StepState],
+    digest_future: Optional[Future] = None,
 ) -> Dict[str, str]:
-    # macOS often denies direct I/O; use large cluster size for performance.
+    """Image the disc with a fast pass followed by a retry pass
+
+    If digest_future is given, the image is hashed while ddrescue writes it and the
+    future receives (sha256, xxh3), or ("", "") if the image has to be rehashed afterwards.
+    """
+    # macOS has no O_DIRECT, so ddrescue's -d is not usable on /dev/rdisk; instead use
+    # 2048-byte sectors with 16384-sector (32 MiB) clusters for large sequential reads.
     stats: Dict[str, str] = {}
-    fast_cmd_nonint = f"sudo -n ddrescue -b 2048 -c 16384 -n {shlex.quote(rdisk)} {shlex.quote(str(iso_path))} {shlex.quote(str(log_path))}"
-    retry_cmd_nonint = f"sudo -n ddrescue -b 2048 -c 16384 -r3 {shlex.quote(rdisk)} {shlex.quote(str(iso_path))} {shlex.quote(str(log_path))}"
-    fast_cmd = fast_cmd_nonint.replace("-n ddrescue", "ddrescue")
-    retry_cmd = retry_cmd_nonint.replace("-n ddrescue", "ddrescue")
-
-    dd_line_re = re.compile(
-        r"pct rescued:\s*(?P<pct>[0-9.]+)%|"
-        r"rescued:\s*(?P<resc_val>[0-9.]+)\s*(?P<resc_unit>kB|MB|GB).*?current rate:\s*(?P<rate_val>[0-9.]+)\s*(?P<rate_unit>kB|MB|GB)/s.*?average rate:\s*(?P<avg_val>[0-9.]+)\s*(?P<avg_unit>kB|MB|GB)/s",
-        re.IGNORECASE,
-    )
+    fast_args = ["ddrescue", "-b", "2048", "-c", "16384", "-n", rdisk, str(iso_path), str(log_path)]
+    retry_args = ["ddrescue", "-b", "2048", "-c", "16384", "-r3", rdisk, str(iso_path), str(log_path)]
+    fast_cmd_nonint = ["sudo", "-n"] + fast_args
+    retry_cmd_nonint = ["sudo", "-n"] + retry_args
+    fast_cmd = ["sudo"] + fast_args
+    retry_cmd = ["sudo"] + retry_args
+    # Determine total bytes for % estimate; the disc does not change between passes
+    total_bytes = get_total_bytes_for_device(rdisk)
 
     def _to_mb_per_s(val: float, unit: str) -> float:
         unit = unit.upper()
@@ -597,17 +1140,14 @@ def ddrescue_fast_then_retry(
         return val
 
     def parse_and_render(line: str, phase: str) -> str:
-        m = dd_line_re.search(line)
+        # Only updates the step; _monitor refreshes the display once per tick
+        m = _RE_DDRESCUE_LINE.search(line)
         if not m:
             steps[phase].message = line[-80:]
-            if refresh_cb:
-                refresh_cb()
             return line
         if m.group("pct"):
             pct = m.group("pct")
             steps[phase].message = f"{pct}% rescued"
-            if refresh_cb:
-                refresh_cb()
             return f"{pct}% rescued"
         else:
             rescued = f"{m.group('resc_val')} {m.group('resc_unit')}"
@@ -617,200 +1157,423 @@ def ddrescue_fast_then_retry(
             avg = f"{avg_mb:.2f} MB/s"
             msg = f"{rate} avg {avg} (rescued {rescued})"
             steps[phase].message = msg
-            if refresh_cb:
-                refresh_cb()
             return msg
 
-    def run_ddrescue(cmd_try_nonint: str, cmd_interactive: str, phase: str) -> bool:
-        steps[phase].status = "running"
-        # Determine total bytes for % estimate
-        total_bytes = get_total_bytes_for_device(rdisk)
-        # First try without prompting for sudo
-        proc = subprocess.Popen(cmd_try_nonint, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
-        last_line = ""
-        samples = deque(maxlen=20)  # ~10s window at 0.5s interval
-        while True:
-            # Read any available output lines without blocking the loop too long
-            if proc.stdout:
-                line = proc.stdout.readline()
-                if line:
-                    last_line = line.strip()
-                    parse_and_render(last_line, phase)
-            # Poll size and compute speed/%
-            try:
-                if iso_path.exists():
-                    sz = iso_path.stat().st_size
-                    now = time.time()
-                    samples.append((now, sz))
-                    mbps = 0.0
-                    if len(samples) >= 2:
-                        # choose an anchor ~5s back if available
-                        t0, s0 = samples[0]
-                        for t, s in samples:
-                            if now - t >= 5.0:
-                                t0, s0 = t, s
-                        dt = max(0.001, now - t0)
-                        delta = max(0, sz - s0)
-                        mbps = (delta / dt) / (1024.0 * 1024.0)
-                    pct = (sz / total_bytes * 100.0) if total_bytes > 0 else 0.0
-                    steps[phase].message = f"{mbps:.2f} MB/s, {pct:.2f}%"
-                    if refresh_cb:
-                        refresh_cb()
-            except Exception:
-                pass
-            if proc.poll() is not None:
-                break
-            time.sleep(0.5)
-        if proc.returncode == 0:
-            steps[phase].status = "done"
-            steps[phase].message = last_line
-            stats[phase] = last_line
-            if refresh_cb:
-                refresh_cb()
-            return True
-        # If sudo needed, fall back to interactive
-        steps[phase].message = "Retrying with sudo (interactive)"
-        if refresh_cb:
-            refresh_cb()
-        proc2 = subprocess.Popen(cmd_interactive, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    def _monitor(proc: subprocess.Popen, phase: str, total_bytes: int, reraise_interrupt: bool) -> str:
+        """Render progress for a running ddrescue until it exits; return its last status line"""
         last_line = ""
-        samples = deque(maxlen=20)
+        samples: deque = deque()
+        watcher = ImageGrowthWatcher(iso_path, proc.pid)
+        grew = True
+        out_fd = proc.stdout.fileno()
+        os.set_blocking(out_fd, False)
+        pending = bytearray()
+        iso_str = os.fspath(iso_path)
         try:
             while True:
-                if proc2.stdout:
-                    line = proc2.stdout.readline()
-                    if line:
-                        last_line = line.strip()
-                        parse_and_render(last_line, phase)
+                # Drain whatever output is available; only the newest status line matters
+                lines = read_available_lines(out_fd, pending)
+                changed = bool(lines)
+                if lines:
+                    last_line = lines[-1]
+                    parse_and_render(last_line, phase)
+                # Poll size and compute speed/% (only when the image changed)
                 try:
-                    if iso_path.exists():
-                        sz = iso_path.stat().st_size
-                        now = time.time()
-                        samples.append((now, sz))
-                        mbps = 0.0
-                        if len(samples) >= 2:
-                            t0, s0 = samples[0]
-                            for t, s in samples:
-                                if now - t >= 5.0:
-                                    t0, s0 = t, s
-                            dt = max(0.001, now - t0)
-                            delta = max(0, sz - s0)
-                            mbps = (delta / dt) / (1024.0 * 1024.0)
+                    # One stat per tick; the image only appears once ddrescue opens it
+                    if grew:
+                        sz = os.stat(iso_str).st_size
+                        mbps = windowed_mb_per_s(samples, time.time(), sz)
                         pct = (sz / total_bytes * 100.0) if total_bytes > 0 else 0.0
                         steps[phase].message = f"{mbps:.2f} MB/s, {pct:.2f}%"
-                        if refresh_cb:
-                            refresh_cb()
+                        changed = True
                 except Exception:
                     pass
-                if proc2.poll() is not None:
+                if changed and refresh_cb:
+                    refresh_cb()
+                if proc.poll() is not None:
                     break
-                time.sleep(0.5)
+                grew = watcher.wait(0.5)
         except KeyboardInterrupt:
-            proc2.send_signal(signal.SIGINT)
-            proc2.wait()
-        steps[phase].status = "done" if proc2.returncode == 0 else "error"
+            proc.send_signal(signal.SIGINT)
+            proc.wait()
+            if reraise_interrupt:
+                raise
+        finally:
+            watcher.close()
+        lines = read_available_lines(out_fd, pending)
+        if pending.strip():
+            lines.append(pending.decode(errors="replace").strip())
+        if lines:
+            last_line = lines[-1]
+        proc.stdout.close()
+        return last_line
+
+    def run_ddrescue(cmd_try_nonint: List[str], cmd_interactive: List[str], phase: str) -> bool:
+        steps[phase].status = "running"
+        # First try without prompting for sudo
+        proc = subprocess.Popen(cmd_try_nonint, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+        last_line = _monitor(proc, phase, total_bytes, reraise_interrupt=True)
+        if proc.returncode != 0:
+            # If sudo needed, fall back to interactive
+            steps[phase].message = "Retrying with sudo (interactive)"
+            if refresh_cb:
+                refresh_cb()
+            proc = subprocess.Popen(cmd_interactive, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+            last_line = _monitor(proc, phase, total_bytes, reraise_interrupt=False)
+        steps[phase].status = "done" if proc.returncode == 0 else "error"
         steps[phase].message = last_line
         stats[phase] = last_line
         if refresh_cb:
             refresh_cb()
-        return proc2.returncode == 0
-
-    ok_fast = run_ddrescue(fast_cmd_nonint, fast_cmd, "ddrescue_fast")
-    ok_retry = run_ddrescue(retry_cmd_nonint, retry_cmd, "ddrescue_retry") if ok_fast else False
+        return proc.returncode == 0
+
+    hash_done = threading.Event()
+    hasher = None
+    if digest_future is not None:
+        hasher = threading.Thread(
+            target=follow_and_hash, args=(iso_path, log_path, hash_done, digest_future), daemon=True
+        )
+        hasher.start()
+    try:
+        ok_fast = run_ddrescue(fast_cmd_nonint, fast_cmd, "ddrescue_fast")
+        fast_blocks = read_ddrescue_map(log_path) if ok_fast else []
+        if ok_fast and fast_blocks and all(status == "+" for _, _, status in fast_blocks) and not DVD_FORCE_RETRY:
+            # Everything was rescued on the fast pass; a retry would just rescan the disc
+            ok_retry = True
+            steps["ddrescue_retry"].status = "done"
+            steps["ddrescue_retry"].message = "skipped (no errors in fast pass)"
+            stats["ddrescue_retry"] = "skipped (no errors in fast pass)"
+            if refresh_cb:
+                refresh_cb()
+        else:
+            ok_retry = run_ddrescue(retry_cmd_nonint, retry_cmd, "ddrescue_retry") if ok_fast else False
+    finally:
+        hash_done.set()
+        if hasher is not None:
+            # Only the tail beyond the last mapfile update is left to hash
+            hasher.join()
     return stats
 
 
-def compute_sha256(path: Path) -> str:
-    """Compute SHA-256 hash using system tools (macOS/Linux) or Python (Windows)"""
-    if IS_WINDOWS:
-        # Use Python's hashlib on Windows for reliability
-        return compute_sha256_python(path)
-    else:
-        rc, out, err = run_cmd(f"shasum -a 256 {shlex.quote(str(path))}")
-        if rc == 0 and out:
-            return out.split()[0]
-        return ""
+def open_uncached(path: Path):
+    """Open a file for unbuffered binary reads that bypass the page cache where possible
+
+    On macOS this sets F_NOCACHE so hashing a multi-GB image does not evict the rest of
+    the working set. Elsewhere the kernel is told the read is sequential so it reads
+    ahead more aggressively.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    if fcntl is not None and hasattr(fcntl, "F_NOCACHE"):
+        try:
+            fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+        except OSError:
+            pass
+    elif hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return os.fdopen(fd, "rb", buffering=0)
 
 
-def compute_sha256_python(path: Path) -> str:
-    """Compute SHA-256 using Python hashlib (cross-platform)"""
-    sha256_hash = hashlib.sha256()
+def compute_sha256(path: Path) -> str:
+    """Compute SHA-256 hash in-process (cross-platform)
+
+    hashlib is backed by OpenSSL, which uses SHA-NI on x86 and the ARMv8 crypto
+    extensions on Apple Silicon, so this is much faster than spawning `shasum`.
+    """
     try:
-        with open(path, "rb") as f:
-            # Read in 8MB chunks for efficiency
-            for chunk in iter(lambda: f.read(8*1024*1024), b""):
-                sha256_hash.update(chunk)
+        if MMAP_HASHING:
+            return hash_mapped(path, hashlib.sha256()).hexdigest()
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+: hashing loop runs in C
+            with open_uncached(path) as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        stream_file_into(path, sha256_hash)
         return sha256_hash.hexdigest()
     except Exception as e:
         safe_print(f"[red]Error computing checksum: {e}[/red]")
         return ""
 
 
-def tool_available(name: str) -> bool:
-    """Check if a command-line tool is available (cross-platform)"""
+def hash_mapped(path: Path, hasher):
+    """Feed a memory-mapped file to hasher.update() in SHA256_CHUNK_SIZE slices"""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hasher  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+            view = memoryview(mm)
+            try:
+                for offset in range(0, len(mm), SHA256_CHUNK_SIZE):
+                    hasher.update(view[offset:offset + SHA256_CHUNK_SIZE])
+            finally:
+                view.release()
+    return hasher
+
+
+class ImageDigest:
+    """SHA-256 for integrity plus xxh3_128 as a dedup fingerprint, fed from the same reads
+
+    The fingerprint is "" when the optional xxhash package is not installed.
+    """
+
+    def __init__(self):
+        self.sha256 = hashlib.sha256()
+        self.xxh3 = xxhash.xxh3_128() if xxhash is not None else None
+
+    def update(self, data) -> None:
+        self.sha256.update(data)
+        if self.xxh3 is not None:
+            self.xxh3.update(data)
+
+    def hexdigests(self) -> Tuple[str, str]:
+        return self.sha256.hexdigest(), self.xxh3.hexdigest() if self.xxh3 is not None else ""
+
+
+def compute_image_digests(path: Path) -> Tuple[str, str]:
+    """Return (sha256, xxh3) of an image from one streaming read, or ("", "") on error"""
+    digest = ImageDigest()
+    try:
+        stream_file_into(path, digest)
+        return digest.hexdigests()
+    except Exception as e:
+        safe_print(f"[red]Error computing checksum: {e}[/red]")
+        return "", ""
+
+
+def sha256_backend() -> Optional[str]:
+    """Return the OpenSSL version behind hashlib.sha256, or None for the slow builtin fallback
+
+    OpenSSL picks SHA-NI (x86) or the ARMv8 SHA instructions at runtime; CPython's own
+    _sha2 module is plain C and several times slower on multi-GB images.
+    """
+    if type(hashlib.sha256()).__module__ != "_hashlib":
+        return None
+    return ssl.OPENSSL_VERSION if ssl is not None else "OpenSSL"
+
+
+def stream_file_into(path: Path, hasher) -> None:
+    """Feed a file to hasher.update() in SHA256_CHUNK_SIZE pieces"""
+    # Unbuffered reads into a reused buffer avoid a copy and an allocation per chunk
+    with open_uncached(path) as f:
+        view = memoryview(bytearray(SHA256_CHUNK_SIZE))
+        while True:
+            n = f.readinto(view)
+            if not n:
+                break
+            hasher.update(view[:n])
+
+
+def copy_and_hash(src: Path, dst: Path) -> str:
+    """Copy src to dst like shutil.copy2 and return the SHA-256 of the copied bytes
+
+    The source is read once and every chunk is written and hashed from the same buffer,
+    so the target does not have to be read back to checksum it. Reads are double-buffered
+    on a helper thread, so the next chunk is read while the current one is written and
+    hashed (file I/O and hashlib both release the GIL).
+    """
+    sha256_hash = hashlib.sha256()
+    views = [memoryview(bytearray(SHA256_CHUNK_SIZE)) for _ in range(2)]
+    with open_uncached(src) as fin, open(dst, "wb", buffering=0) as fout, \
+            ThreadPoolExecutor(max_workers=1) as reader:
+        current = 0
+        next_read = reader.submit(fin.readinto, views[current])
+        while True:
+            n = next_read.result()
+            if not n:
+                break
+            view = views[current]
+            current ^= 1
+            next_read = reader.submit(fin.readinto, views[current])
+            fout.write(view[:n])
+            sha256_hash.update(view[:n])
+    shutil.copystat(src, dst)
+    return sha256_hash.hexdigest()
+
+
+def fast_copy(src, dst) -> None:
+    """shutil.copy2, but let Windows copy the file itself
+
+    shutil already uses fcopyfile on macOS and sendfile on Linux, but on Windows (before
+    Python 3.12) it falls back to a Python read/write loop. CopyFileExW copies in the OS,
+    server-side when both paths are on the same SMB share, and keeps timestamps.
+    """
     if IS_WINDOWS:
-        # Check if executable exists in script directory subfolder (common for Windows portable apps)
-        script_dir = Path(__file__).parent.resolve()
-        subfolder_exe = script_dir / name / f"{name}.exe"
-        if subfolder_exe.exists():
-            return True
+        try:
+            if ctypes.windll.kernel32.CopyFileExW(str(src), str(dst), None, None, None, 0):
+                return
+        except Exception:
+            pass
+    shutil.copy2(src, dst)
 
-        # Check for versioned subfolders (e.g., iat-0.1.7.win32)
-        # Look for any folder starting with the tool name
-        for folder in script_dir.iterdir():
-            if folder.is_dir() and folder.name.lower().startswith(name.lower()):
-                versioned_exe = folder / f"{name}.exe"
-                if versioned_exe.exists():
-                    return True
-
-        # Check if executable exists in script directory (project root)
-        script_exe = script_dir / f"{name}.exe"
-        if script_exe.exists():
-            return True
 
-        # Also check current working directory
-        local_exe = Path(f"{name}.exe").resolve()
-        if local_exe.exists():
-            return True
+def clone_or_link(src: Path, dst: Path, allow_hardlink: bool = False) -> Optional[str]:
+    """Create dst without copying any data, if the filesystem allows it
 
-        # Finally check system PATH using 'where' command
-        rc, out, _ = run_cmd(f"where {name}")
-        return rc == 0 and out.strip() != ""
-    else:
-        # On Unix-like systems, use 'command -v'
-        rc, out, _ = run_cmd(f"command -v {shlex.quote(name)}")
-        return rc == 0 and out.strip() != ""
+    Tries a copy-on-write clone (clonefile on APFS, FICLONE on Btrfs/XFS), then, only if
+    allow_hardlink is set, a hardlink on the same device. Returns "clone"/"hardlink", or
+    None if the caller has to copy the bytes.
+    """
+    try:
+        if IS_MACOS:
+            libc = ctypes.CDLL("libc.dylib", use_errno=True)
+            if libc.clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0:
+                return "clone"
+        elif fcntl is not None and sys.platform.startswith("linux"):
+            with open(src, "rb") as fin, open(dst, "wb") as fout:
+                try:
+                    fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+                    cloned = True
+                except OSError:
+                    cloned = False
+            if cloned:
+                shutil.copystat(src, dst)
+                return "clone"
+            dst.unlink()
+    except Exception:
+        pass
+    # A hardlink shares the source inode, so later edits to either side show up in both
+    if allow_hardlink:
+        try:
+            if os.stat(src).st_dev == os.stat(dst.parent).st_dev:
+                os.link(src, dst)
+                return "hardlink"
+        except OSError:
+            pass
+    return None
+
+
+def _remove_path(path: Path) -> bool:
+    """Delete a file or a whole directory tree; False if it is gone already or locked"""
+    try:
+        if path.is_dir() and not path.is_symlink():
+            shutil.rmtree(path)
+        else:
+            path.unlink()
+        return True
+    except OSError:
+        return False
+
+
+def remove_paths(paths: List[Path]) -> List[Path]:
+    """Delete files/directory trees, several at a time, and return the ones removed
+
+    Every unlink/rmdir is a blocking metadata syscall; keeping a few in flight lets the
+    filesystem batch the journal work instead of round-tripping one entry at a time.
+    """
+    if len(paths) <= 1:
+        return [p for p in paths if _remove_path(p)]
+    with ThreadPoolExecutor(max_workers=min(len(paths), REMOVE_WORKERS)) as pool:
+        return [p for p, removed in zip(paths, pool.map(_remove_path, paths)) if removed]
+
+
+def find_archived_fingerprint(fingerprint: str, disc_number: str) -> Optional[str]:
+    """Return the number of another archived disc with the same xxh3 fingerprint, if any"""
+    for number, entry in load_archive_json().items():
+        if number != disc_number and entry.get("disc", {}).get("fingerprint_xxh3") == fingerprint:
+            return number
+    return None
+
+
+# Tool lookups never change during a run; cache them instead of re-probing per call
+_TOOL_AVAILABLE_CACHE: Dict[str, bool] = {}
+
+
+def tool_available(name: str) -> bool:
+    """Check if a command-line tool is available (cross-platform), cached per process"""
+    if name not in _TOOL_AVAILABLE_CACHE:
+        _TOOL_AVAILABLE_CACHE[name] = _probe_tool(name)
+    return _TOOL_AVAILABLE_CACHE[name]
+
+
+def _probe_tool(name: str) -> bool:
+    """Probe the filesystem/PATH for a command-line tool (uncached)"""
+    if IS_WINDOWS and _find_local_exe(name) is not None:
+        return True
+    # Finally check system PATH (pure-Python walk, no 'where'/'command -v' subprocess)
+    return tool_path(name) is not None
+
+
+@functools.lru_cache(maxsize=None)
+def tool_path(name: str) -> Optional[str]:
+    """Absolute path of a tool on PATH, looked up once per process
+
+    Passing it as argv[0] also spares the exec call its own PATH search.
+    """
+    return shutil.which(name)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_local_exe(name: str) -> Optional[Path]:
+    """Find a Windows portable tool shipped next to the script or in the cwd"""
+    script_dir = Path(__file__).parent.resolve()
+
+    # Check subfolder with exact name (common for Windows portable apps)
+    subfolder_exe = script_dir / name / f"{name}.exe"
+    if os.path.isfile(subfolder_exe):
+        return subfolder_exe
+
+    # Check versioned subfolders (e.g., iat-0.1.7.win32); DirEntry.is_dir() reuses the
+    # directory listing instead of stat-ing each entry again
+    prefix = name.lower()
+    with os.scandir(script_dir) as entries:
+        for entry in entries:
+            if entry.name.lower().startswith(prefix) and entry.is_dir():
+                versioned_exe = Path(entry.path) / f"{name}.exe"
+                if os.path.isfile(versioned_exe):
+                    return versioned_exe
+
+    # Check script directory root
+    script_exe = script_dir / f"{name}.exe"
+    if os.path.isfile(script_exe):
+        return script_exe
+
+    # Check current directory
+    local_exe = Path(f"{name}.exe").resolve()
+    if os.path.isfile(local_exe):
+        return local_exe
+    return None
 
 
 def find_tool_path(name: str) -> Optional[Path]:
     """Find the full path to a tool executable"""
     if IS_WINDOWS:
-        script_dir = Path(__file__).parent.resolve()
+        local_exe = _find_local_exe(name)
+        if local_exe is not None:
+            return local_exe
 
-        # Check subfolder with exact name
-        subfolder_exe = script_dir / name / f"{name}.exe"
-        if subfolder_exe.exists():
-            return subfolder_exe
+    # Resolved PATH entry, or just the name if it is not on PATH
+    return Path(tool_path(name) or name)
 
-        # Check versioned subfolders
-        for folder in script_dir.iterdir():
-            if folder.is_dir() and folder.name.lower().startswith(name.lower()):
-                versioned_exe = folder / f"{name}.exe"
-                if versioned_exe.exists():
-                    return versioned_exe
 
-        # Check script directory root
-        script_exe = script_dir / f"{name}.exe"
-        if script_exe.exists():
-            return script_exe
+def converted_size_problem(mdx_size: int, iso_size: int) -> Optional[str]:
+    """Return why a converted ISO looks truncated, or None if its size is plausible
 
-        # Check current directory
-        local_exe = Path(f"{name}.exe").resolve()
-        if local_exe.exists():
-            return local_exe
+    The ISO should be about as large as the MDX; more than 15% smaller means the
+    conversion most likely failed part-way.
+    """
+    if mdx_size > 0 and iso_size / mdx_size >= 0.85:
+        return None
+    return f"Converted ISO is too small ({iso_size / (1024**3):.2f}GB vs {mdx_size / (1024**3):.2f}GB MDX)"
+
+
+# Name prefix of IAT staging folders in the target root (swept at copy-mode start)
+IAT_STAGING_PREFIX = ".iat_tmp_"
 
-    # Return just the name for PATH lookup
-    return Path(name)
+
+def make_conversion_temp_dir(iso_path: Path) -> Path:
+    """Create the IAT working folder, preferably in the target root
+
+    Staging on the target's own volume turns the final move into a rename instead of a
+    second multi-GB copy; C:/temp (or the system temp dir) is only the fallback. The
+    folder sits next to the disc folders, not inside one, so a single listing of the
+    target finds what an interrupted conversion left behind.
+    """
+    try:
+        return Path(tempfile.mkdtemp(prefix=IAT_STAGING_PREFIX, dir=iso_path.parent.parent))
+    except OSError:
+        return Path(tempfile.mkdtemp(dir="C:/temp" if Path("C:/temp").exists() else None))
 
 
 def convert_mdx_to_iso(mdx_path: Path, iso_path: Path) -> tuple[bool, str]:
@@ -822,64 +1585,72 @@ def convert_mdx_to_iso(mdx_path: Path, iso_path: Path) -> tuple[bool, str]:
     if tool_available("iat"):
         # Find the full path to iat executable
         iat_path = find_tool_path("iat")
+        mdx_size = mdx_path.stat().st_size
+        iso_size: Optional[int] = None
 
         if IS_WINDOWS:
-            # IAT has issues with paths containing escape sequences
-            # Use temp folder on C: drive (NVME) for faster conversion
-            import subprocess
-            import tempfile
-            import shutil
+            # IAT has issues with paths containing escape sequences, so it runs from a
+            # temp folder with relative file names
+            temp_dir = make_conversion_temp_dir(iso_path)
 
-            # Create temp directory on C: drive (project root or system temp)
-            temp_dir = Path(tempfile.mkdtemp(dir="C:/temp" if Path("C:/temp").exists() else None))
+            # Resolve every path once; each resolve() is a filesystem round-trip
+            iat_str = str(iat_path)
+            temp_dir_str = str(temp_dir)
+            mdx_resolved = str(mdx_path.resolve())
+            iso_resolved = str(iso_path.resolve())
 
             try:
                 # Copy MDX to temp folder
                 temp_mdx = temp_dir / mdx_path.name
-                shutil.copy2(str(mdx_path.resolve()), str(temp_mdx))
+                fast_copy(mdx_resolved, str(temp_mdx))
 
                 # Convert in temp folder using relative paths
                 iso_name = iso_path.name
                 proc = subprocess.Popen(
-                    [str(iat_path), "-i", mdx_path.name, "-o", iso_name, "--iso"],
-                    cwd=str(temp_dir),
+                    [iat_str, "-i", mdx_path.name, "-o", iso_name, "--iso"],
+                    cwd=temp_dir_str,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.PIPE,
-                    text=True
+                    creationflags=subprocess.CREATE_NO_WINDOW  # no console flash per conversion
                 )
-                out, err = proc.communicate()
+                # Captured as bytes and decoded once, like run_cmd()
+                out_bytes, err_bytes = proc.communicate()
+                out = out_bytes.decode("utf-8", "replace")
+                err = err_bytes.decode("utf-8", "replace")
                 rc = proc.returncode
 
                 # Move the ISO to final target if successful
                 if rc == 0:
                     temp_iso = temp_dir / iso_name
-                    if temp_iso.exists():
-                        # Validate file size - ISO should be similar to MDX (allow 5% variance)
-                        mdx_size = mdx_path.stat().st_size
+                    try:
                         iso_size = temp_iso.stat().st_size
-                        size_ratio = iso_size / mdx_size if mdx_size > 0 else 0
-
-                        if size_ratio < 0.85:  # ISO is more than 15% smaller - likely corrupted
-                            return False, f"✗ Converted ISO is too small ({iso_size / (1024**3):.2f}GB vs {mdx_size / (1024**3):.2f}GB MDX) - likely corrupted"
-
-                        shutil.move(str(temp_iso), str(iso_path.resolve()))
+                    except FileNotFoundError:
+                        iso_size = None
+                    if iso_size is not None:
+                        # Validate before moving, so a truncated ISO never reaches the target
+                        problem = converted_size_problem(mdx_size, iso_size)
+                        if problem:
+                            return False, f"✗ {problem} - likely corrupted"
+
+                        shutil.move(str(temp_iso), iso_resolved, copy_function=fast_copy)
             finally:
                 # Clean up temp directory
                 if temp_dir.exists():
-                    shutil.rmtree(str(temp_dir), ignore_errors=True)
+                    shutil.rmtree(temp_dir_str, ignore_errors=True)
         else:
-            cmd = f"{shlex.quote(str(iat_path))} -i {shlex.quote(str(mdx_path))} -o {shlex.quote(str(iso_path))} --iso"
-            rc, out, err = run_cmd(cmd)
-
-        if rc == 0 and iso_path.exists():
-            # Validate file size for non-Windows too
-            mdx_size = mdx_path.stat().st_size
-            iso_size = iso_path.stat().st_size
-            size_ratio = iso_size / mdx_size if mdx_size > 0 else 0
-
-            if size_ratio < 0.85:  # ISO is more than 15% smaller
+            rc, out, err = run_cmd([str(iat_path), "-i", str(mdx_path), "-o", str(iso_path), "--iso"])
+            if rc == 0:
+                try:
+                    iso_size = iso_path.stat().st_size
+                except FileNotFoundError:
+                    iso_size = None
+
+        if rc == 0 and iso_size is not None:
+            # Sizes were taken once above (on Windows from the temp ISO, already checked)
+            problem = converted_size_problem(mdx_size, iso_size)
+            if problem:
                 iso_path.unlink()  # Delete corrupted ISO
-                return False, f"✗ Converted ISO is too small ({iso_size / (1024**3):.2f}GB vs {mdx_size / (1024**3):.2f}GB MDX) - deleted"
+                return False, f"✗ {problem} - deleted"
 
             return True, f"✓ Converted: {mdx_path.name} → {iso_path.name}"
         else:
@@ -898,9 +1669,9 @@ def convert_mdx_to_iso(mdx_path: Path, iso_path: Path) -> tuple[bool, str]:
     # Check for AnyToISO (commercial alternative with free tier)
     elif tool_available("anytoiso"):
         if IS_WINDOWS:
-            cmd = f'anytoiso /convert "{mdx_path.resolve()}" "{iso_path.resolve()}"'
+            cmd = ["anytoiso", "/convert", str(mdx_path.resolve()), str(iso_path.resolve())]
         else:
-            cmd = f"anytoiso /convert {shlex.quote(str(mdx_path))} {shlex.quote(str(iso_path))}"
+            cmd = ["anytoiso", "/convert", str(mdx_path), str(iso_path)]
 
         rc, out, err = run_cmd(cmd)
         if rc == 0 and iso_path.exists():
@@ -924,32 +1695,29 @@ def run_dvdisaster(path: Path, parity_out: Path, percent: int = 10) -> bool:
 
         # Check for subfolder version first (portable app with DLLs)
         subfolder_exe = script_dir / "dvdisaster" / "dvdisaster.exe"
+        # Without a shell the executable is not looked up in cwd, so pass full paths
         if subfolder_exe.exists():
             # Run from subfolder so DLLs can be found
-            dvdisaster_cmd = "dvdisaster.exe"
+            dvdisaster_cmd = str(subfolder_exe)
             cwd = str(script_dir / "dvdisaster")
         # Check script directory
         elif (script_dir / "dvdisaster.exe").exists():
             # Run from script directory so DLLs can be found
-            dvdisaster_cmd = "dvdisaster.exe"
+            dvdisaster_cmd = str(script_dir / "dvdisaster.exe")
             cwd = str(script_dir)
         # Then check current working directory
         elif Path("dvdisaster.exe").exists():
-            dvdisaster_cmd = ".\\dvdisaster.exe"
+            dvdisaster_cmd = str(Path("dvdisaster.exe").resolve())
         # Finally use system PATH
         else:
-            dvdisaster_cmd = "dvdisaster"
-        # Windows: double backslashes to avoid escape sequence issues
+            dvdisaster_cmd = tool_path("dvdisaster") or "dvdisaster"
         # Note: RS03 with -o file creates separate .ecc files
         # -o file means "put ecc data in a file" (separate mode)
-        # Double backslashes so they're not interpreted as escape sequences
-        input_path = str(path.resolve()).replace('\\', '\\\\')
-        output_path = str(parity_out.resolve()).replace('\\', '\\\\')
-        cmd = f'{dvdisaster_cmd} -i "{input_path}" -e "{output_path}" -mRS03 -c -n{percent}% -o file'
+        # Paths go in as argv entries (no shell), so backslashes need no escaping
+        cmd = [dvdisaster_cmd, "-i", str(path.resolve()), "-e", str(parity_out.resolve()), "-mRS03", "-c", f"-n{percent}%", "-o", "file"]
     else:
-        # Unix: use shlex.quote
         # RS03 with -o file creates separate .ecc files
-        cmd = f"dvdisaster -i {shlex.quote(str(path))} -e {shlex.quote(str(parity_out))} -mRS03 -c -n{percent}% -o file"
+        cmd = [tool_path("dvdisaster") or "dvdisaster", "-i", str(path), "-e", str(parity_out), "-mRS03", "-c", f"-n{percent}%", "-o", "file"]
 
     rc, out, err = run_cmd(cmd, cwd=cwd)
 
@@ -977,55 +1745,64 @@ def hdiutil_image(
         try:
             cdr_path.unlink()
         except Exception:
-            run_cmd(f"sudo rm -f {shlex.quote(str(cdr_path))}")
+            run_cmd(["sudo", "rm", "-f", str(cdr_path)])
     # Use -puppetstrings for parseable progress output
-    cmd = f"sudo hdiutil create -puppetstrings -srcdevice {shlex.quote(rdisk)} -format UDTO -o {shlex.quote(str(out_prefix))}"
-    proc = subprocess.Popen(cmd, shell=True, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    cmd = ["sudo", "hdiutil", "create", "-puppetstrings", "-srcdevice", rdisk, "-format", "UDTO", "-o", str(out_prefix)]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
     total_bytes = get_total_bytes_for_device(rdisk)
     last_line = ""
-    prev_samples: List[Tuple[float, int]] = []
+    samples: deque = deque()
+    out_fd = proc.stdout.fileno()
+    os.set_blocking(out_fd, False)
+    pending = bytearray()
+    hdiutil_pct: Optional[float] = None
+    size_pct = 0.0
+    mbps: Optional[float] = None
+    next_stat_at = 0.0
     while True:
-        if proc.stdout:
-            line = proc.stdout.readline()
-            if line:
-                last_line = line.strip()
+        changed = False
+        # Drain puppetstrings output; only the newest progress line matters
+        lines = read_available_lines(out_fd, pending)
+        if lines:
+            last_line = lines[-1]
+            for line in reversed(lines):
                 # Parse puppetstrings progress like: PERCENT: 12.34
-                m = re.search(r"PERCENT:\s*([0-9.]+)", last_line)
+                m = _RE_HDIUTIL_PCT.search(line)
                 if m:
                     try:
-                        pct = float(m.group(1))
-                        steps["ddrescue_fast"].message = f"{pct:.2f}%"
-                        if refresh_cb:
-                            refresh_cb()
-                    except Exception:
+                        hdiutil_pct = float(m.group(1))
+                        changed = True
+                    except ValueError:
                         pass
-        # Poll size of .cdr while writing
-        if cdr_path.exists():
+                    break
+        # hdiutil reports the percentage itself; the .cdr size is only needed for MB/s
+        now = time.time()
+        if now >= next_stat_at:
+            next_stat_at = now + 2.0
             try:
-                sz = cdr_path.stat().st_size
-                now = time.time()
-                prev_samples.append((now, sz))
-                # keep last 20 samples (~10s)
-                if len(prev_samples) > 20:
-                    prev_samples = prev_samples[-20:]
-                mbps = 0.0
-                if len(prev_samples) >= 2:
-                    t0, s0 = prev_samples[0]
-                    for t, s in prev_samples:
-                        if now - t >= 5.0:
-                            t0, s0 = t, s
-                    dt = max(0.001, now - t0)
-                    delta = max(0, sz - s0)
-                    mbps = (delta / dt) / (1024.0 * 1024.0)
-                pct = (sz / total_bytes * 100.0) if total_bytes > 0 else 0.0
-                steps["ddrescue_fast"].message = f"{mbps:.2f} MB/s, {pct:.2f}%"
-                if refresh_cb:
-                    refresh_cb()
-            except Exception:
+                sz = os.stat(cdr_path).st_size
+                mbps = windowed_mb_per_s(samples, now, sz)
+                size_pct = (sz / total_bytes * 100.0) if total_bytes > 0 else 0.0
+                changed = True
+            except FileNotFoundError:
                 pass
+        if changed:
+            # PERCENT: -1 means hdiutil cannot tell yet
+            pct = hdiutil_pct if hdiutil_pct is not None and hdiutil_pct >= 0 else size_pct
+            speed = f"{mbps:.2f} MB/s, " if mbps is not None else ""
+            steps["ddrescue_fast"].message = f"{speed}{pct:.2f}%"
+            if refresh_cb:
+                refresh_cb()
         if proc.poll() is not None:
             break
-        time.sleep(0.5)
+        # Wake up as soon as hdiutil prints something, or after 0.5 s to poll the .cdr
+        select.select([out_fd], [], [], 0.5)
+    lines = read_available_lines(out_fd, pending)
+    if pending.strip():
+        lines.append(pending.decode(errors="replace").strip())
+    if lines:
+        last_line = lines[-1]
+    proc.stdout.close()
     ok = proc.returncode == 0
     steps["ddrescue_fast"].status = "done" if ok else "error"
     steps["ddrescue_fast"].message = last_line
@@ -1042,6 +1819,74 @@ def hdiutil_image(
     return True
 
 
+def dd_image(
+    rdisk: str,
+    iso_path: Path,
+    refresh_cb: Optional[Callable[[], None]],
+    steps: Dict[str, StepState],
+    digest_future: Optional[Future] = None,
+) -> bool:
+    """Image the disc by piping `dd` into Python, writing and hashing each block in one pass
+
+    ddrescue needs a seekable output file, so this mode trades its retry logic for a
+    single streaming pass: the ISO is never re-read for the checksum, and F_NOCACHE
+    keeps the written image out of the macOS page cache.
+    """
+    steps["ddrescue_fast"].status = "running"
+    cmd = ["sudo", "dd", f"if={rdisk}", f"bs={IMAGE_BLOCK_SIZE}"]
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=0)
+    total_bytes = get_total_bytes_for_device(rdisk)
+    digest = ImageDigest()
+    written = 0
+    samples: deque = deque()
+    last_render = 0.0
+    try:
+        with open(iso_path, "wb", buffering=0) as out:
+            if fcntl is not None and hasattr(fcntl, "F_NOCACHE"):
+                try:
+                    fcntl.fcntl(out.fileno(), fcntl.F_NOCACHE, 1)
+                except OSError:
+                    pass
+            view = memoryview(bytearray(SHA256_CHUNK_SIZE))
+            while True:
+                n = proc.stdout.readinto(view)
+                if not n:
+                    break
+                out.write(view[:n])
+                digest.update(view[:n])
+                written += n
+                now = time.time()
+                if now - last_render >= 0.5:
+                    last_render = now
+                    mbps = windowed_mb_per_s(samples, now, written)
+                    pct = (written / total_bytes * 100.0) if total_bytes > 0 else 0.0
+                    steps["ddrescue_fast"].message = f"{mbps:.2f} MB/s, {pct:.2f}%"
+                    if refresh_cb:
+                        refresh_cb()
+    except KeyboardInterrupt:
+        proc.send_signal(signal.SIGINT)
+        proc.wait()
+        raise
+    except OSError as e:
+        proc.kill()
+        proc.wait()
+        steps["ddrescue_fast"].status = "error"
+        steps["ddrescue_fast"].message = f"write failed: {e}"
+        return False
+    proc.wait()
+    ok = proc.returncode == 0 and written > 0
+    steps["ddrescue_fast"].status = "done" if ok else "error"
+    steps["ddrescue_fast"].message = f"{written / (1024 ** 3):.2f} GB imaged" if ok else f"dd exited with {proc.returncode}"
+    # dd has no retry pass; mark the step done so it does not hold back archive.success
+    steps["ddrescue_retry"].status = "done"
+    steps["ddrescue_retry"].message = "n/a in dd mode"
+    if digest_future is not None:
+        digest_future.set_result(digest.hexdigests() if ok else ("", ""))
+    if refresh_cb:
+        refresh_cb()
+    return ok
+
+
 def validate_source_paths(source_paths: List[str]) -> List[str]:
     """Validate and return available source paths"""
     available = []
@@ -1054,6 +1899,90 @@ def validate_source_paths(source_paths: List[str]) -> List[str]:
     return available
 
 
+def walk_files(root: str):
+    """Yield a DirEntry for every file below root, without following directory symlinks"""
+    stack = [root]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        yield entry
+        except OSError:
+            continue
+
+
+def find_undersized_isos(root: str) -> List[Tuple[Path, int, int]]:
+    """Find ISOs that are much smaller than the MDX sitting next to them
+
+    One walk groups .mdx/.iso entries per directory by normalized name ("01" == "1"), so
+    only matching pairs are stat-ed. Returns (iso_path, iso_size, mdx_size) tuples.
+    """
+    by_dir: Dict[str, Tuple[Dict[str, list], list]] = {}
+    for entry in walk_files(root):
+        stem, ext = os.path.splitext(entry.name)
+        ext = ext.lower()
+        if ext in (".mdx", ".iso"):
+            mdx_by_name, isos = by_dir.setdefault(os.path.dirname(entry.path), ({}, []))
+            if ext == ".mdx":
+                mdx_by_name.setdefault(normalize_stem(stem), []).append(entry)
+            else:
+                isos.append((normalize_stem(stem), entry))
+
+    undersized = []
+    for mdx_by_name, isos in by_dir.values():
+        for name, iso_entry in isos:
+            for mdx_entry in mdx_by_name.get(name, ()):
+                iso_size = iso_entry.stat().st_size
+                mdx_size = mdx_entry.stat().st_size
+                if converted_size_problem(mdx_size, iso_size):
+                    undersized.append((Path(iso_entry.path), iso_size, mdx_size))
+                    break
+    return undersized
+
+
+def is_rotational(path: Path) -> Optional[bool]:
+    """Best-effort check whether path is on a spinning disk; None when it cannot tell
+
+    Linux reads the block queue's rotational flag, macOS asks diskutil for SolidState.
+    Network shares, Windows and failed probes all come back as None.
+    """
+    try:
+        if sys.platform.startswith("linux"):
+            dev = os.stat(path).st_dev
+            sys_dev = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+            # A partition has no queue/ of its own; its parent disk does
+            for flag in (f"{sys_dev}/queue/rotational", f"{sys_dev}/../queue/rotational"):
+                if os.path.exists(flag):
+                    with open(flag) as f:
+                        return f.read().strip() == "1"
+        elif IS_MACOS:
+            mount = os.path.abspath(path)
+            while not os.path.ismount(mount):
+                mount = os.path.dirname(mount)
+            solid_state = (diskutil_info(mount) or {}).get("SolidState")
+            if isinstance(solid_state, bool):
+                return not solid_state
+    except OSError:
+        pass
+    return None
+
+
+def subdirs_with_prefix(parent: Path, prefix: str) -> List[Path]:
+    """List the directories directly under parent whose name starts with prefix
+
+    DirEntry.is_dir() answers from the directory listing, so unlike glob() + is_dir()
+    this costs no stat per entry. Symlinks are not followed.
+    """
+    try:
+        with os.scandir(parent) as entries:
+            return [Path(e.path) for e in entries if e.name.startswith(prefix) and e.is_dir(follow_symlinks=False)]
+    except OSError:
+        return []
+
+
 def find_all_numbered_folders(source_path: str) -> List[Tuple[str, str, str]]:
     """
     Find all numbered folders in source path.
@@ -1072,14 +2001,14 @@ def find_all_numbered_folders(source_path: str) -> List[Tuple[str, str, str]]:
 
     folders = []
 
-    for item in source.iterdir():
-        if item.is_dir():
-            # Extract numbers from folder name
-            numbers = re.findall(r'\d+', item.name)
-            if numbers:
-                # Use first numeric sequence as folder number
-                folder_num = numbers[0]
-                folders.append((folder_num, item.name, str(item)))
+    # DirEntry caches the entry type from the directory listing, so is_dir() needs no stat
+    with os.scandir(source) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                # Use first numeric sequence in the folder name as folder number
+                m = _RE_DIGITS.search(entry.name)
+                if m:
+                    folders.append((m.group(0), entry.name, entry.path))
 
     # Sort by numeric value (convert to int for proper numeric sorting)
     folders.sort(key=lambda x: int(x[0]))
@@ -1092,22 +2021,23 @@ def extract_title_from_folder(folder_name: str) -> str:
     Returns sanitized title with spaces replaced by underscores
     """
     # Remove leading numbers and common separators
-    title = re.sub(r'^\d+[\s\-_.]*', '', folder_name)
+    title = _RE_LEADING_NUMBER.sub('', folder_name)
     if title:
         # Replace spaces with underscores and clean up multiple underscores
         title = title.replace(' ', '_')
-        title = re.sub(r'_+', '_', title)  # Replace multiple underscores with single
+        title = _RE_UNDERSCORE_RUN.sub('_', title)  # Replace multiple underscores with single
         title = title.strip('_')  # Remove leading/trailing underscores
         return title
     # If nothing left, return the original folder name (sanitized)
     folder_name = folder_name.replace(' ', '_')
-    folder_name = re.sub(r'_+', '_', folder_name)
+    folder_name = _RE_UNDERSCORE_RUN.sub('_', folder_name)
     folder_name = folder_name.strip('_')
     return folder_name
 
 
 def process_single_folder(folder_number: str, folder_name: str, folder_path: str,
-                          target: Path, state: Dict, source_path: str, convert_mdx: bool = False) -> bool:
+                          target: Path, state: Dict, source_path: str, convert_mdx: bool = False,
+                          allow_hardlink: bool = False) -> bool:
     """Process a single folder with DVD images using per-disc state tracking
 
     Args:
@@ -1118,19 +2048,23 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
         state: Shared state dictionary for per-disc tracking
         source_path: Source path this folder belongs to (for statistics)
         convert_mdx: Whether to convert MDX files to ISO
+        allow_hardlink: Whether same-volume files may be hardlinked instead of copied
 
     Returns True if successful, False otherwise
     """
     # Find all image files in the folder (expanded formats)
     folder_p = Path(folder_path)
 
-    image_files = []
-    # Use case-insensitive patterns (glob is case-sensitive on some systems)
-    # On Windows, file system is case-insensitive but glob behavior varies
-    # Supported formats: ISO, IMG, CDR (macOS), MDF/MDS (Alcohol 120%), MDX (Media Data eXtended), NRG (Nero), BIN/CUE
-    for ext in ['*.iso', '*.ISO', '*.img', '*.IMG', '*.cdr', '*.CDR', '*.mdf', '*.MDF', '*.mdx', '*.MDX', '*.nrg', '*.NRG', '*.bin', '*.BIN']:
-        found = list(folder_p.glob(ext))
-        image_files.extend(found)
+    # One directory pass with a case-insensitive suffix check (instead of one glob per
+    # extension and case); each entry is yielded once, so no de-duplication is needed
+    try:
+        with os.scandir(folder_p) as entries:
+            image_files = [
+                Path(entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1][1:].lower() in IMAGE_EXTENSIONS and entry.is_file()
+            ]
+    except OSError:
+        image_files = []
 
     # Show all files in folder if no images found (helps diagnose issues)
     if not image_files:
@@ -1149,18 +2083,6 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
         safe_print("[yellow]Supported formats: .iso, .img, .cdr, .mdf, .mdx, .nrg, .bin[/yellow]")
         return False
 
-    # Remove true duplicates (same full path) but keep files with same name and different extensions
-    # Example: both 700.mdx and 700.iso should be processed separately
-    seen = set()
-    unique_files = []
-    for f in image_files:
-        # Normalize full path for comparison (lowercase on Windows for case-insensitive filesystems)
-        normalized = str(f.resolve()).lower() if IS_WINDOWS else str(f.resolve())
-        if normalized not in seen:
-            seen.add(normalized)
-            unique_files.append(f)
-    image_files = unique_files
-
     # Sort files by stem (base name without extension) then by extension for consistent ordering
     # This groups files like: 700.iso, 700.mdx, 700_1.iso, 700_1.mdx, etc.
     image_files.sort(key=lambda x: (x.stem.lower(), x.suffix.lower()))
@@ -1169,7 +2091,7 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
     # This ensures we always convert from MDX source instead of copying existing ISO
     if convert_mdx:
         # Helper to normalize stem by stripping leading zeros for comparison
-        def normalize_stem(stem: str) -> str:
+        def _normalize_group_stem(stem: str) -> str:
             """Strip leading zeros from numeric parts and normalize separators for matching
 
             Examples:
@@ -1180,7 +2102,6 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
                 '702 V8' -> '702_v8'
                 '702V8' -> '702v8'
             """
-            import re
             # First normalize separators: convert spaces and dashes to underscores
             normalized = stem.lower().replace(' ', '_').replace('-', '_')
 
@@ -1188,19 +2109,19 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
             def strip_leading_zeros(match):
                 num = match.group(0).lstrip('0')
                 return num if num else '0'  # Keep at least one zero
-            return re.sub(r'\d+', strip_leading_zeros, normalized)
+            return _RE_DIGITS.sub(strip_leading_zeros, normalized)
 
         # Build a set of normalized stems that have MDX files
         mdx_stems = set()
         for f in image_files:
             if f.suffix.lower() == '.mdx':
-                mdx_stems.add(normalize_stem(f.stem))
+                mdx_stems.add(_normalize_group_stem(f.stem))
 
         # Filter out ISO files that have matching MDX
         filtered_files = []
         skipped_isos = []
         for f in image_files:
-            if f.suffix.lower() == '.iso' and normalize_stem(f.stem) in mdx_stems:
+            if f.suffix.lower() == '.iso' and _normalize_group_stem(f.stem) in mdx_stems:
                 # Skip this ISO - we'll convert from MDX instead
                 skipped_isos.append(f.name)
             else:
@@ -1257,29 +2178,7 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
     )
 
     # Create progress table
-    def render_table() -> Table:
-        t = Table(title=f"Processing: {folder_name}")
-        t.add_column("Step")
-        t.add_column("Status")
-        t.add_column("Message")
-        status_style = {
-            "pending": "grey50",
-            "running": "yellow",
-            "done": "green",
-            "error": "red",
-            "skipped": "blue",
-        }
-        for key in ["validate", "copy", "checksum", "parity"]:
-            s = steps[key]
-            mark = {
-                "pending": "[ ]",
-                "running": "[~]",
-                "done": "[x]",
-                "error": "[!]",
-                "skipped": "[-]",
-            }[s.status]
-            t.add_row(s.name, f"[{status_style[s.status]}]{mark} {s.status}[/]", s.message)
-        return t
+    step_table = StepTable(f"Processing: {folder_name}", steps, COPY_STEP_ORDER)
 
     # On Windows, use static output instead of Live updates to avoid ANSI code issues
     # Live updates work fine on macOS/Linux with proper terminal support
@@ -1287,17 +2186,23 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
 
     if use_live_updates:
         refresh_rate = 0.5 if IS_WINDOWS else 1
-        live_context = Live(render_table(), refresh_per_second=refresh_rate, console=console, auto_refresh=False)
+        live_context = Live(step_table, refresh_per_second=refresh_rate, console=console, auto_refresh=False)
     else:
         # Dummy context manager for Windows
-        from contextlib import nullcontext
         live_context = nullcontext()
 
-    with live_context as live:
-        # Helper to update and refresh in one call
-        def update_live():
+    with live_context as live, ExitStack() as cleanup:
+        # Helper to update and refresh in one call. Per-file progress redraws are throttled
+        # (dropped when closer than 100 ms to the previous draw); step transitions (start,
+        # done, failed) pass force=True so they are always drawn
+        last_render = [0.0]
+
+        def update_live(force: bool = False):
             if use_live_updates:
-                live.update(render_table())
+                now = time.monotonic()
+                if not force and now - last_render[0] < 0.1:
+                    return
+                last_render[0] = now
                 live.refresh()
             else:
                 # On Windows, print static status updates (plain text, no colors)
@@ -1316,22 +2221,34 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
             cprint(f"⟳ {steps['copy'].name}...", 'yellow')
 
         copied_files = []
+        # Plain copies are hashed as they are copied; converted, cloned and linked files are
+        # hashed in the background while the next file is processed. checksum_jobs[i] and
+        # copied_targets[i] belong to copied_files[i]
+        # hashlib releases the GIL on large updates, so two files stream in parallel
+        hash_pool = ThreadPoolExecutor(max_workers=max(1, min(len(image_files), HASH_WORKERS)))
+        # On every early exit (failure, Ctrl+C, SIGTERM) drop the hashes still queued;
+        # otherwise interpreter shutdown would wait for each of them to finish
+        cleanup.callback(hash_pool.shutdown, wait=False, cancel_futures=True)
+        checksum_jobs: List[Future] = []
+        copied_targets: List[Path] = []
 
         # Group files by base name (stem) to handle same file in multiple formats (e.g., 700.mdx + 700.iso)
         # This ensures both get the same number suffix
         file_groups = {}
+        disc_nums: Dict[Path, Optional[str]] = {}
         for src_file in image_files:
             stem = src_file.stem
             # Normalize stem: remove spaces
             normalized_stem = stem.replace(' ', '_')
             # Extract any existing disc number from stem (e.g., "700_1" -> "1", "disc2" -> "2")
-            disc_num_match = re.search(r'_(\d+)$|disc(\d+)$', normalized_stem, re.IGNORECASE)
+            disc_num_match = _RE_DISC_SUFFIX.search(normalized_stem)
             if disc_num_match:
                 disc_num = disc_num_match.group(1) or disc_num_match.group(2)
-                base_stem = re.sub(r'[_-]?\d+$|disc\d+$', '', normalized_stem, flags=re.IGNORECASE).strip('_-')
+                base_stem = _RE_DISC_SUFFIX_STRIP.sub('', normalized_stem).strip('_-')
             else:
                 disc_num = None
                 base_stem = normalized_stem
+            disc_nums[src_file] = disc_num
 
             key = (base_stem.lower(), disc_num)
             if key not in file_groups:
@@ -1347,6 +2264,14 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
                 file_groups[(base_stem, str(next_auto_num))] = file_groups.pop((base_stem, None))
                 next_auto_num += 1
 
+        # Source file -> disc number of the group it ended up in (first group wins)
+        group_nums: Dict[Path, str] = {}
+        for (_, dn), files in file_groups.items():
+            if dn:
+                for f in files:
+                    group_nums.setdefault(f, dn)
+
+        folder_suffix_re = re.compile(rf'^{re.escape(folder_number)}(.*)$', re.IGNORECASE)
         for idx, src_file in enumerate(image_files, 1):
             stem = src_file.stem
             # Normalize stem: remove spaces and convert to underscores
@@ -1363,20 +2288,14 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
             # - IMG: varies by creator, keep as-is
             normalized_ext = src_file.suffix
 
-            # Find which group this file belongs to
-            disc_num_match = re.search(r'_(\d+)$|disc(\d+)$', normalized_stem, re.IGNORECASE)
-            if disc_num_match:
-                disc_num = disc_num_match.group(1) or disc_num_match.group(2)
-                base_stem = re.sub(r'[_-]?\d+$|disc\d+$', '', normalized_stem, flags=re.IGNORECASE).strip('_-')
-            else:
-                disc_num = None
-                base_stem = normalized_stem
+            # Disc number parsed in the grouping pass above
+            disc_num = disc_nums[src_file]
 
             # Extract non-numeric suffix after the folder number
             # E.g., "702_V8" with folder_number "702" -> suffix "_V8"
             #       "702V8" with folder_number "702" -> suffix "V8"
             #       "702 V8" normalized to "702_V8" -> suffix "_V8"
-            suffix_match = re.match(rf'^{re.escape(folder_number)}(.*)$', normalized_stem, re.IGNORECASE)
+            suffix_match = folder_suffix_re.match(normalized_stem)
             if suffix_match and suffix_match.group(1):
                 # File has extra content after folder number (e.g., "V8", "_V8")
                 file_suffix = suffix_match.group(1)
@@ -1389,19 +2308,15 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
             if len(file_groups) == 1 and disc_num is None:
                 # Single disc (or multiple formats of same disc) - use folder number + any suffix
                 target_filename = f"{padded_number}{file_suffix}{normalized_ext}"
+            elif disc_num:
+                # Multi-disc set or explicitly numbered - preserve disc number
+                target_filename = f"{padded_number}_{disc_num}{normalized_ext}"
+            elif src_file in group_nums:
+                # Number assigned to this file's group above
+                target_filename = f"{padded_number}_{group_nums[src_file]}{normalized_ext}"
             else:
-                # Multi-disc set or explicitly numbered - preserve/assign disc number
-                if disc_num:
-                    target_filename = f"{padded_number}_{disc_num}{normalized_ext}"
-                else:
-                    # Find assigned number from file_groups
-                    for (bs, dn), files in file_groups.items():
-                        if src_file in files and dn:
-                            target_filename = f"{padded_number}_{dn}{normalized_ext}"
-                            break
-                    else:
-                        # Fallback to sequential
-                        target_filename = f"{padded_number}_disc{idx}{normalized_ext}"
+                # Fallback to sequential
+                target_filename = f"{padded_number}_disc{idx}{normalized_ext}"
 
             target_file = target_folder / target_filename
 
@@ -1440,10 +2355,12 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
                         "checksum": "",
                         "parity_path": "",
                     })
+                    checksum_jobs.append(hash_pool.submit(compute_sha256, iso_target))
+                    copied_targets.append(iso_target)
                 else:
                     steps["copy"].status = "error"
                     steps["copy"].message = message
-                    update_live()
+                    update_live(force=True)
                     return False
             else:
                 # Regular copy for all other formats
@@ -1455,17 +2372,25 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
                     update_live()
 
                 try:
-                    shutil.copy2(src_file, target_file)
+                    # Replace, never write through: it may be a hardlink to a source image
+                    target_file.unlink(missing_ok=True)
+                    if clone_or_link(src_file, target_file, allow_hardlink):
+                        job = hash_pool.submit(compute_sha256, target_file)
+                    else:
+                        job = Future()
+                        job.set_result(copy_and_hash(src_file, target_file))
                     copied_files.append({
                         "source_path": str(src_file),
                         "target_path": str(target_file),
                         "checksum": "",
                         "parity_path": "",
                     })
+                    checksum_jobs.append(job)
+                    copied_targets.append(target_file)
                 except Exception as e:
                     steps["copy"].status = "error"
                     steps["copy"].message = f"Failed to copy {src_file.name}: {e}"
-                    update_live()
+                    update_live(force=True)
                     return False
 
         steps["copy"].status = "done"
@@ -1473,71 +2398,93 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
         if not use_live_updates:
             cprint(f"✓ {steps['copy'].name}: {steps['copy'].message}", 'green')
         else:
-            update_live()
+            update_live(force=True)
 
         # Generate checksums
         steps["checksum"].status = "running"
         if not use_live_updates:
             cprint(f"⟳ {steps['checksum'].name}...", 'yellow')
         else:
-            update_live()
+            update_live(force=True)
 
-        for idx, file_info in enumerate(copied_files, 1):
-            target_file = Path(file_info["target_path"])
+        for idx, (file_info, job, target_file) in enumerate(zip(copied_files, checksum_jobs, copied_targets), 1):
             steps["checksum"].message = f"Computing checksum for {target_file.name} ({idx}/{len(copied_files)})"
 
             if not use_live_updates:
                 cprint(f"  Computing checksum for {target_file.name}...", 'dim')
+            else:
+                update_live()
 
-            checksum = compute_sha256(target_file)
+            checksum = job.result()
             if checksum:
                 file_info["checksum"] = checksum
                 # Save checksum to file
-                checksum_path = target_file.with_suffix(target_file.suffix + ".sha256")
+                checksum_path = file_info["target_path"] + ".sha256"
                 try:
-                    with open(checksum_path, "w") as f:
-                        f.write(f"{checksum}  {target_file.name}\n")
+                    # A few dozen bytes: skip the buffered/text file object layers
+                    # O_BINARY: without it the Windows CRT turns the "\n" into CRLF
+                    fd = os.open(checksum_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+                    try:
+                        os.write(fd, f"{checksum}  {target_file.name}\n".encode("utf-8"))
+                    finally:
+                        os.close(fd)
                 except Exception as e:
                     # Suppress - error message is in Live context
                     pass
             else:
                 steps["checksum"].status = "error"
                 steps["checksum"].message = f"Failed to compute checksum for {target_file.name}"
-                update_live()
+                update_live(force=True)
                 return False
+        hash_pool.shutdown()
 
         steps["checksum"].status = "done"
         steps["checksum"].message = f"{len(copied_files)} checksum(s) created"
         if not use_live_updates:
             cprint(f"✓ {steps['checksum'].name}: {steps['checksum'].message}", 'green')
         else:
-            update_live()
+            update_live(force=True)
 
         # Create parity files
         steps["parity"].status = "running"
+        steps["parity"].message = f"Creating parity for {len(copied_files)} file(s)"
         if not use_live_updates:
             cprint(f"⟳ {steps['parity'].name}...", 'yellow')
         else:
-            update_live()
+            update_live(force=True)
 
         parity_created = 0
-        for idx, file_info in enumerate(copied_files, 1):
-            target_file = Path(file_info["target_path"])
-            parity_path = target_file.with_suffix(target_file.suffix + ".ecc")
-
-            steps["parity"].message = f"Creating parity for {target_file.name} ({idx}/{len(copied_files)})"
-
-            if not use_live_updates:
-                cprint(f"  Creating parity for {target_file.name}...", 'dim')
-            else:
-                update_live()
-
-            if run_dvdisaster(target_file, parity_path):
-                file_info["parity_path"] = str(parity_path)
-                parity_created += 1
-            else:
-                # dvdisaster not available or failed, but don't error out
-                steps["parity"].message = f"Parity creation skipped/failed for {target_file.name}"
+        # Each dvdisaster run is its own subprocess, so threads are enough to overlap them;
+        # results are collected here, on the main thread, as they finish. RS03 encoding is
+        # CPU-bound on SSDs, but on a spinning disk parallel runs only make the heads seek
+        # between images, so those get one run at a time. Unknown media (network shares,
+        # Windows) keep the conservative PARITY_WORKERS cap
+        target_rotational = is_rotational(target_folder)
+        parity_workers = max(1, min(len(copied_files), os.cpu_count() or 1))
+        if target_rotational:
+            parity_workers = 1
+        elif target_rotational is None:
+            parity_workers = min(parity_workers, PARITY_WORKERS)
+        if not use_live_updates:
+            media = {True: "rotational", False: "solid-state", None: "unknown"}[target_rotational]
+            cprint(f"  {parity_workers} parallel dvdisaster run(s) ({media} target)", 'dim')
+        with ThreadPoolExecutor(max_workers=parity_workers) as parity_pool:
+            parity_jobs = {}
+            for file_info, target_file in zip(copied_files, copied_targets):
+                parity_path = target_file.with_suffix(target_file.suffix + ".ecc")
+                if not use_live_updates:
+                    cprint(f"  Creating parity for {target_file.name}...", 'dim')
+                parity_jobs[parity_pool.submit(run_dvdisaster, target_file, parity_path)] = (file_info, target_file, parity_path)
+
+            for idx, job in enumerate(as_completed(parity_jobs), 1):
+                file_info, target_file, parity_path = parity_jobs[job]
+                if job.result():
+                    file_info["parity_path"] = str(parity_path)
+                    parity_created += 1
+                    steps["parity"].message = f"Created parity for {target_file.name} ({idx}/{len(copied_files)})"
+                else:
+                    # dvdisaster not available or failed, but don't error out
+                    steps["parity"].message = f"Parity creation skipped/failed for {target_file.name}"
                 update_live()
 
         if parity_created > 0:
@@ -1553,15 +2500,13 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
             else:
                 cprint(f"− {steps['parity'].name}: {steps['parity'].message}", 'cyan')
         else:
-            update_live()
+            update_live(force=True)
 
         # Mark each disc as completed in state
-        for file_info in copied_files:
-            target_file_path = Path(file_info["target_path"])
-            target_filename = target_file_path.name
+        for file_info, target_file in zip(copied_files, copied_targets):
             mark_disc_completed(
                 state=state,
-                target_filename=target_filename,
+                target_filename=target_file.name,
                 source_path=file_info["source_path"],
                 target_path=file_info["target_path"],
                 folder_number=padded_number,
@@ -1570,10 +2515,9 @@ def process_single_folder(folder_number: str, folder_name: str, folder_path: str
                 parity_path=file_info.get("parity_path", "")
             )
 
-    # Mark folder as completed and save state
+    # Mark folder as completed (the caller persists the state)
     mark_folder_completed(state, padded_number, final_title)
     update_path_statistics(state, source_path, success=True, discs_count=len(copied_files))
-    save_copy_state(state)
 
     safe_print(f"\n[bold green]{'━'*80}[/bold green]")
     safe_print(f"[bold green]✓ SUCCESS:[/bold green] [bold white]{folder_name}[/bold white]")
@@ -1592,41 +2536,41 @@ def print_final_summary(state: Dict, source_paths: List[str]):
 
     path_stats = state.get("path_statistics", {})
     folder_metadata = state.get("folder_metadata", {})
+    stat_keys = ("folders_processed", "folders_failed", "discs_processed")
+    no_stats = dict.fromkeys(stat_keys, 0)
+
+    # Folders that used up their retries (folder_metadata is not tracked per path)
+    failed_folders_all = [
+        (num, meta) for num, meta in folder_metadata.items()
+        if meta.get("status") == "failed" and meta.get("retry_count", 0) >= MAX_RETRIES
+    ]
 
     # Per-path statistics
     for idx, src_path in enumerate(source_paths, 1):
-        stats = path_stats.get(src_path, {"folders_processed": 0, "folders_failed": 0, "discs_processed": 0})
+        stats = path_stats.get(src_path, no_stats)
         safe_print(f"[bold yellow]Path {idx}:[/bold yellow] [dim]{src_path}[/dim]")
         safe_print(f"  [bold green]✓ Folders processed:[/bold green] [white]{stats['folders_processed']}[/white]")
         safe_print(f"  [bold red]✗ Folders failed:[/bold red] [white]{stats['folders_failed']}[/white]")
         safe_print(f"  [bold cyan]◆ Discs processed:[/bold cyan] [white]{stats['discs_processed']}[/white]")
 
         # Show failed folders for this path
-        failed_folders = [
-            (num, meta) for num, meta in folder_metadata.items()
-            if meta.get("status") == "failed" and meta.get("retry_count", 0) >= 5
-        ]
-        if failed_folders:
-            safe_print(f"  [dim yellow]⚠ Failed: {', '.join([f[0] for f in failed_folders])}[/dim yellow]")
-        safe_print()
-
-    # Total statistics
-    total_folders_processed = sum(s.get("folders_processed", 0) for s in path_stats.values())
-    total_folders_failed = sum(s.get("folders_failed", 0) for s in path_stats.values())
-    total_discs_processed = sum(s.get("discs_processed", 0) for s in path_stats.values())
+        if failed_folders_all:
+            safe_print(f"  [dim yellow]⚠ Failed: {', '.join([f[0] for f in failed_folders_all])}[/dim yellow]")
+        safe_print("")
+
+    # Total statistics, summed in one pass over the per-path counters
+    totals = dict.fromkeys(stat_keys, 0)
+    for stats in path_stats.values():
+        for key in stat_keys:
+            totals[key] += stats.get(key, 0)
 
     safe_print(f"[bold cyan]{'─'*80}[/bold cyan]")
     safe_print("[bold white]TOTAL RESULTS:[/bold white]")
-    safe_print(f"  [bold green]✓ Folders processed:[/bold green] [bold white]{total_folders_processed}[/bold white]")
-    safe_print(f"  [bold red]✗ Folders failed:[/bold red] [bold white]{total_folders_failed}[/bold white]")
-    safe_print(f"  [bold cyan]◆ Discs processed:[/bold cyan] [bold white]{total_discs_processed}[/bold white]")
+    safe_print(f"  [bold green]✓ Folders processed:[/bold green] [bold white]{totals['folders_processed']}[/bold white]")
+    safe_print(f"  [bold red]✗ Folders failed:[/bold red] [bold white]{totals['folders_failed']}[/bold white]")
+    safe_print(f"  [bold cyan]◆ Discs processed:[/bold cyan] [bold white]{totals['discs_processed']}[/bold white]")
 
     # Show folders needing attention
-    failed_folders_all = [
-        (num, meta) for num, meta in folder_metadata.items()
-        if meta.get("status") == "failed" and meta.get("retry_count", 0) >= 5
-    ]
-
     if failed_folders_all:
         safe_print(f"\n[bold red on yellow] ⚠ FOLDERS NEEDING ATTENTION [/bold red on yellow]")
         for folder_num, meta in failed_folders_all:
@@ -1638,44 +2582,40 @@ def print_final_summary(state: Dict, source_paths: List[str]):
     safe_print(f"\n[bold cyan]{'═'*80}[/bold cyan]\n")
 
 
-def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_from: str = None) -> int:
+def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_from: str = None,
+                   allow_hardlink: bool = False) -> int:
     """Main function for copy mode (-c option)
 
     Args:
         process_all: If True, process all folders without user confirmation
         convert_mdx: If True, convert MDX files to ISO during processing
         start_from: If provided, start processing from this folder number (e.g., '696' or '0696')
+        allow_hardlink: If True, hardlink images when source and target share a volume
     """
     safe_print(Panel.fit("[bold cyan]DVD Archiver - Copy Mode[/bold cyan]"))
 
     # Debug: show terminal capabilities
     if IS_WINDOWS:
-        import sys as _dbg_sys
-        _is_tty = _dbg_sys.stdout.isatty() if hasattr(_dbg_sys.stdout, 'isatty') else False
+        _is_tty = sys.stdout.isatty() if hasattr(sys.stdout, 'isatty') else False
         safe_print(f"[dim]Debug: VT100={VT100_ENABLED}, isatty={_is_tty}, legacy_windows={console.legacy_windows}, color_system={console.color_system}[/dim]")
 
     # Normalize start_from to 4-digit padded format
     start_from_padded = None
     if start_from:
         # Extract digits and pad to 4 digits
-        import re
-        match = re.search(r'\d+', start_from)
+        match = _RE_DIGITS.search(start_from)
         if match:
             start_from_padded = match.group(0).zfill(4)
             safe_print(f"[bold yellow]Starting from folder: {start_from_padded}[/bold yellow]")
 
     # Clean up temp directories from previous runs
-    import tempfile
-    import shutil
     temp_base = Path("C:/temp") if Path("C:/temp").exists() else Path(tempfile.gettempdir())
-    cleaned_count = 0
-    for temp_dir in temp_base.glob("tmp*"):
-        if temp_dir.is_dir():
-            try:
-                shutil.rmtree(str(temp_dir))
-                cleaned_count += 1
-            except Exception:
-                pass  # Ignore locked/in-use temp folders
+    # Locked/in-use temp folders are skipped
+    cleaned_count = len(remove_paths(subdirs_with_prefix(temp_base, "tmp")))
+    # A killed IAT conversion leaves its staging folder, with a full MDX copy, in the
+    # target root
+    if TARGET_PATH:
+        cleaned_count += len(remove_paths(subdirs_with_prefix(Path(TARGET_PATH), IAT_STAGING_PREFIX)))
     if cleaned_count > 0:
         safe_print(f"[dim]Cleaned up {cleaned_count} temp folder(s)[/dim]")
 
@@ -1700,30 +2640,14 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
                 path_str = path_str.strip()
                 source_path = Path(path_str).resolve()
                 if source_path.exists() and source_path.is_dir():
-                    # Find all MDX files and check for matching undersized ISOs
-                    for mdx_file in source_path.rglob("*.mdx"):
-                        # Look for matching ISO (with or without leading zeros)
-                        mdx_stem = mdx_file.stem
-                        mdx_size = mdx_file.stat().st_size
-
-                        # Check same folder for ISOs
-                        for iso_file in mdx_file.parent.glob("*.iso"):
-                            # Check if ISO matches MDX name (with normalization)
-                            import re
-                            def normalize_name(name):
-                                return re.sub(r'\d+', lambda m: m.group(0).lstrip('0') or '0', name.lower())
-
-                            if normalize_name(iso_file.stem) == normalize_name(mdx_stem):
-                                iso_size = iso_file.stat().st_size
-                                size_ratio = iso_size / mdx_size if mdx_size > 0 else 0
-
-                                if size_ratio < 0.85:  # Undersized
-                                    try:
-                                        iso_file.unlink()
-                                        cleaned_isos += 1
-                                        safe_print(f"[dim yellow]  ✗ Deleted undersized: {iso_file.name} ({iso_size / (1024**3):.2f}GB vs {mdx_size / (1024**3):.2f}GB)[/dim yellow]")
-                                    except Exception:
-                                        pass
+                    # Find ISOs next to an MDX of the same name (with or without leading zeros)
+                    for iso_file, iso_size, mdx_size in find_undersized_isos(str(source_path)):
+                        try:
+                            iso_file.unlink()
+                            cleaned_isos += 1
+                            safe_print(f"[dim yellow]  ✗ Deleted undersized: {iso_file.name} ({iso_size / (1024**3):.2f}GB vs {mdx_size / (1024**3):.2f}GB)[/dim yellow]")
+                        except Exception:
+                            pass
 
             if cleaned_isos > 0:
                 safe_print(f"[yellow]Cleaned up {cleaned_isos} corrupted ISO file(s)[/yellow]")
@@ -1737,6 +2661,13 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
     else:
         safe_print("[yellow]! dvdisaster not found (parity files will be skipped)[/yellow]")
 
+    # Checksums of every copied disc go through hashlib; say which implementation it uses
+    hash_backend = sha256_backend()
+    if hash_backend:
+        safe_print(f"[dim]SHA-256 via {hash_backend}[/dim]")
+    else:
+        safe_print("[yellow]! hashlib is not backed by OpenSSL (checksums will be slow)[/yellow]")
+
     # Load existing state (new per-disc tracking format)
     state = load_copy_state()
 
@@ -1747,6 +2678,7 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
 
         # Clear all discs belonging to folders >= start_from_padded
         discs_to_remove = []
+        target_files = []
         for disc_filename, disc_data in state.get("processed_files", {}).items():
             folder_num = disc_data.get("folder_number", "")
             if folder_num >= start_from_padded:
@@ -1754,17 +2686,14 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
                 # Also delete the target file/folder
                 target_path = disc_data.get("target_path", "")
                 if target_path:
-                    target_file = Path(target_path)
-                    if target_file.exists():
-                        try:
-                            target_file.unlink()
-                            safe_print(f"[dim]  Deleted: {target_file.name}[/dim]")
-                        except Exception:
-                            pass
+                    target_files.append(Path(target_path))
+        for target_file in remove_paths(target_files):
+            safe_print(f"[dim]  Deleted: {target_file.name}[/dim]")
 
         # Remove from state
         for disc_filename in discs_to_remove:
             del state["processed_files"][disc_filename]
+        _invalidate_normalized_index(state)
 
         # Clear folder metadata for folders >= start_from_padded
         folders_to_remove = [f for f in state.get("folder_metadata", {}).keys() if f >= start_from_padded]
@@ -1774,15 +2703,14 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
         # Also delete target folders
         if TARGET_PATH:
             target_base = Path(TARGET_PATH)
-            for folder_num in folders_to_remove:
-                # Find matching folders with this number
-                for target_folder in target_base.glob(f"{folder_num}_*"):
-                    if target_folder.is_dir():
-                        try:
-                            shutil.rmtree(str(target_folder))
-                            safe_print(f"[dim]  Deleted folder: {target_folder.name}[/dim]")
-                        except Exception:
-                            pass
+            # One listing of the target, matched against the removed numbers ("0696_Title")
+            removed_numbers = set(folders_to_remove)
+            target_folders = [
+                folder for folder in subdirs_with_prefix(target_base, "")
+                if "_" in folder.name and folder.name.split("_", 1)[0] in removed_numbers
+            ]
+            for target_folder in remove_paths(target_folders):
+                safe_print(f"[dim]  Deleted folder: {target_folder.name}[/dim]")
 
         save_copy_state(state)
         safe_print(f"[green]Cleared {len(discs_to_remove)} disc(s) from state[/green]")
@@ -1793,7 +2721,8 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
         if not process_all:
             if not Confirm.ask("Continue from previous state?", default=True):
                 safe_print("[yellow]Starting fresh. Creating new state...[/yellow]")
-                state = load_copy_state()  # Reset to empty state
+                reset_copy_state(state)
+                save_copy_state(state)
         else:
             safe_print("[yellow]Continuing from previous state...[/yellow]")
 
@@ -1832,9 +2761,32 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
         else:
             return 1
 
-    # Sequential path processing with retry logic
-    MAX_RETRIES = 5
+    state_writer = StateWriter(state)
+    # The default SIGTERM action kills the process without running `finally`; turn it into
+    # SystemExit so the queued state is flushed below (SystemExit is not an Exception, so
+    # the per-folder error handler does not treat it as a failed folder)
+    def _exit_on_sigterm(signum, frame):
+        raise SystemExit(128 + signum)
+
+    previous_sigterm = signal.signal(signal.SIGTERM, _exit_on_sigterm)
+    try:
+        _process_source_paths(available_paths, target, state, state_writer,
+                              process_all, convert_mdx, start_from_padded, allow_hardlink)
+    finally:
+        # Also on Ctrl+C or SIGTERM, so finished folders are not processed again next run
+        state_writer.flush(sync=True)
+        signal.signal(signal.SIGTERM, previous_sigterm)
+
+    # Print final summary
+    print_final_summary(state, available_paths)
+
+    return 0
+
 
+def _process_source_paths(available_paths: List[str], target: Path, state: Dict, state_writer: StateWriter,
+                          process_all: bool, convert_mdx: bool, start_from_padded: Optional[str],
+                          allow_hardlink: bool) -> None:
+    """Run process_single_folder over every numbered folder of every source path"""
     # Process each source path sequentially
     for src_path in available_paths:
         safe_print(f"\n{'='*80}")
@@ -1884,7 +2836,7 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
             try:
                 success = process_single_folder(
                     folder_number, folder_name, folder_path,
-                    target, state, src_path, convert_mdx
+                    target, state, src_path, convert_mdx, allow_hardlink
                 )
 
                 if not success:
@@ -1922,19 +2874,20 @@ def copy_mode_main(process_all: bool = False, convert_mdx: bool = False, start_f
                 # Update statistics
                 update_path_statistics(state, src_path, success=False)
 
-                # Save state
-                save_copy_state(state)
+                # Save and fsync now, not batched: the retry count must survive a crash, or a
+                # folder that keeps killing the run would never reach MAX_RETRIES
+                state_writer.mark_dirty()
+                state_writer.flush(sync=True)
 
                 safe_print(f"[bold yellow]⟳ Retry {new_retry_count}/{MAX_RETRIES} for folder {padded_number}[/bold yellow]\n")
+            else:
+                # Queue a state save for the completed folder
+                state_writer.mark_dirty()
 
             # If not in auto mode, stop after one folder
             if not process_all:
                 break
 
-    # Print final summary
-    print_final_summary(state, available_paths)
-
-    return 0
 
 def main() -> int:
     # Auto-detect disc/device first to derive disc number from label
@@ -1945,7 +2898,7 @@ def main() -> int:
 
     # Try to extract a numeric identifier from the disc label
     label = get_disc_label(disk) or "disc"
-    m = re.search(r"(\d{3,})", label)
+    m = _RE_DISC_NUMBER.search(label)
     disc_number = m.group(1) if m else label
 
     # Prepare output paths per disc number
@@ -1960,9 +2913,9 @@ def main() -> int:
                     try:
                         p.unlink()
                     except Exception:
-                        run_cmd(f"sudo rm -f {shlex.quote(str(p))}")
+                        run_cmd(["sudo", "rm", "-f", str(p)])
         except Exception:
-            run_cmd(f"sudo rm -rf {shlex.quote(str(disc_dir))}")
+            run_cmd(["sudo", "rm", "-rf", str(disc_dir)])
             disc_dir.mkdir(parents=True, exist_ok=True)
     else:
         disc_dir.mkdir(parents=True, exist_ok=True)
@@ -1997,41 +2950,13 @@ def main() -> int:
         success=False,
     )
 
-    table = Table(title=f"DVD Archiver - Disc {disc_number}")
-    table.add_column("Step")
-    table.add_column("Status")
-    table.add_column("Message")
-
-    def render_table() -> Table:
-        t = Table(title=f"DVD Archiver - Disc {disc_number}")
-        t.add_column("Step")
-        t.add_column("Status")
-        t.add_column("Message")
-        status_style = {
-            "pending": "grey50",
-            "running": "yellow",
-            "done": "green",
-            "error": "red",
-            "skipped": "blue",
-        }
-        for key in ["detect", "unmount", "ddrescue_fast", "ddrescue_retry", "checksum", "parity", "eject"]:
-            s = steps[key]
-            mark = {
-                "pending": "[ ]",
-                "running": "[~]",
-                "done": "[x]",
-                "error": "[!]",
-                "skipped": "[-]",
-            }[s.status]
-            t.add_row(s.name, f"[{status_style[s.status]}]{mark} {s.status}[/]", s.message)
-        return t
+    step_table = StepTable(f"DVD Archiver - Disc {disc_number}", steps, IMAGING_STEP_ORDER)
 
     # Use lower refresh rate on Windows to reduce ANSI code issues
     refresh_rate = 0.5 if IS_WINDOWS else 1
-    with Live(render_table(), refresh_per_second=refresh_rate, console=console, auto_refresh=False) as live:
-        # Helper to update and refresh in one call
+    with Live(step_table, refresh_per_second=refresh_rate, console=console, auto_refresh=False) as live:
+        # The table reads step state when drawn, so a refresh is all that is needed
         def update_live():
-            live.update(render_table())
             live.refresh()
 
         # Detect (already done above)
@@ -2045,7 +2970,7 @@ def main() -> int:
 
         # Check tools availability
         missing_tools = []
-        for tool in ["drutil", "diskutil", "ddrescue", "shasum"]:
+        for tool in ["drutil", "diskutil", "ddrescue"]:
             if not tool_available(tool):
                 missing_tools.append(tool)
         if missing_tools:
@@ -2056,7 +2981,7 @@ def main() -> int:
             return 2
 
         # Save drutil status
-        rc, drout, _ = run_cmd("drutil status")
+        rc, drout = drutil_status()
         with open(info_path, "w") as f:
             f.write(drout)
 
@@ -2073,19 +2998,30 @@ def main() -> int:
         if not ok_unmount:
             safe_print("[yellow]Continuing even if unmount failed; macOS may auto-mount optical discs read-only.[/yellow]")
 
-        # Imaging (mode-dependent)
+        # Imaging (mode-dependent); ddrescue and dd modes hash the image while it is written
+        digest_future: Future = Future()
         if DVD_MODE == "hdiutil":
             steps["ddrescue_fast"].status = "running"
             update_live()
-            ok = hdiutil_image(rdisk, disc_dir / f"disc_{disc_number}", lambda: live.update(render_table()), steps)
+            ok = hdiutil_image(rdisk, disc_dir / f"disc_{disc_number}", live.refresh, steps)
             archive.ddrescue_stats = {}
             update_live()
             if not ok:
                 safe_print("[red]Imaging failed with hdiutil.[/red]", highlight=False)
+        elif DVD_MODE == "dd":
+            steps["ddrescue_fast"].status = "running"
+            update_live()
+            ok = dd_image(rdisk, iso_path, live.refresh, steps, digest_future=digest_future)
+            archive.ddrescue_stats = {}
+            update_live()
+            if not ok:
+                safe_print("[red]Imaging failed with dd.[/red]", highlight=False)
         else:
             steps["ddrescue_fast"].status = "running"
             update_live()
-            dd_stats = ddrescue_fast_then_retry(rdisk, iso_path, log_path, lambda: live.update(render_table()), steps)
+            dd_stats = ddrescue_fast_then_retry(
+                rdisk, iso_path, log_path, live.refresh, steps, digest_future=digest_future
+            )
             archive.ddrescue_stats = dd_stats
             update_live()
             if steps["ddrescue_fast"].status == "error":
@@ -2095,50 +3031,66 @@ def main() -> int:
             safe_print("[red]ISO not created. Aborting subsequent steps.[/red]")
             archive.end_time = datetime.now(timezone.utc).isoformat()
             archive.success = False
-            archive_db = load_archive_json()
-            archive_db[disc_number] = {
-                "disc": asdict(archive)
-            }
-            save_archive_json(archive_db)
+            append_archive_entry(disc_number, {"disc": asdict(archive)})
             return 3
 
         # Ensure archive ownership (ddrescue may write as root)
         try:
-            run_cmd(f"sudo chown -R {os.geteuid()}:{os.getegid()} {shlex.quote(str(disc_dir))}")
+            run_cmd(["sudo", "chown", "-R", f"{os.geteuid()}:{os.getegid()}", str(disc_dir)])
         except Exception:
             pass
 
-        # checksum
-        steps["checksum"].status = "running"
-        update_live()
-        checksum = compute_sha256(iso_path) if iso_path.exists() else ""
-        if checksum:
-            steps["checksum"].status = "done"
-            steps["checksum"].message = checksum[:16] + "..."
-            archive.checksum_sha256 = checksum
-            with open(sha_path, "w") as f:
-                f.write(checksum + "  " + str(iso_path.name) + "\n")
-        else:
-            steps["checksum"].status = "error"
-            steps["checksum"].message = "failed"
-        update_live()
+        def finish_checksum(digests: Tuple[str, str]) -> None:
+            checksum, fingerprint = digests
+            if checksum:
+                steps["checksum"].status = "done"
+                steps["checksum"].message = checksum[:16] + "..."
+                archive.checksum_sha256 = checksum
+                with open(sha_path, "w") as f:
+                    f.write(checksum + "  " + str(iso_path.name) + "\n")
+                if fingerprint:
+                    archive.fingerprint_xxh3 = fingerprint
+                    duplicate = find_archived_fingerprint(fingerprint, disc_number)
+                    if duplicate:
+                        steps["checksum"].message += f" (same content as disc {duplicate})"
+            else:
+                steps["checksum"].status = "error"
+                steps["checksum"].message = "failed"
 
-        # parity (optional)
+        def finish_parity(parity_ok: bool) -> None:
+            if parity_ok:
+                steps["parity"].status = "done"
+                steps["parity"].message = "created"
+            else:
+                steps["parity"].status = "skipped"
+                steps["parity"].message = "dvdisaster not available or failed"
+
+        # checksum and parity (optional) are independent, so run them side by side. The
+        # rehash reads with F_NOCACHE, so both jobs go to the disk: unless the target is
+        # known to be solid-state, run them one after the other instead of seeking
+        steps["checksum"].status = "running"
         steps["parity"].status = "running"
         update_live()
-        parity_ok = run_dvdisaster(iso_path, ecc_path)
-        if parity_ok:
-            steps["parity"].status = "done"
-            steps["parity"].message = "created"
-        else:
-            steps["parity"].status = "skipped"
-            steps["parity"].message = "dvdisaster not available or failed"
-        update_live()
+        digests = digest_future.result() if digest_future.done() else ("", "")
+        with ThreadPoolExecutor(max_workers=2 if is_rotational(disc_dir) is False else 1) as pool:
+            jobs = {pool.submit(run_dvdisaster, iso_path, ecc_path): "parity"}
+            if not digests[0] and iso_path.exists():
+                # Not hashed during imaging (hdiutil mode, or sectors rescued out of order)
+                jobs[pool.submit(compute_image_digests, iso_path)] = "checksum"
+            else:
+                finish_checksum(digests)
+                update_live()
+            for job in as_completed(jobs):
+                if jobs[job] == "checksum":
+                    finish_checksum(job.result())
+                else:
+                    finish_parity(job.result())
+                update_live()
 
         # eject
         steps["eject"].status = "running"
         update_live()
-        rc, _, _ = run_cmd(f"diskutil eject {shlex.quote(disk)}")
+        rc, _, _ = run_cmd(["diskutil", "eject", disk])
         steps["eject"].status = "done" if rc == 0 else "error"
         steps["eject"].message = "ejected" if rc == 0 else "failed"
         update_live()
@@ -2147,11 +3099,7 @@ def main() -> int:
     archive.success = all(steps[k].status == "done" for k in steps)
 
     # Persist to JSON archive
-    archive_db = load_archive_json()
-    archive_db[disc_number] = {
-        "disc": asdict(archive)
-    }
-    save_archive_json(archive_db)
+    append_archive_entry(disc_number, {"disc": asdict(archive)})
 
     safe_print(Panel.fit(Text(f"Disc {disc_number} {'archived successfully' if archive.success else 'completed with issues'}", style="green" if archive.success else "yellow")))
     safe_print(f"Outputs in: {disc_dir}")
@@ -2183,12 +3131,18 @@ if __name__ == "__main__":
         default=None,
         help="Start processing from a specific folder number (e.g., 696 or 0696), clearing its state and overwriting files (use with -c and -a)"
     )
+    parser.add_argument(
+        "--allow-hardlink",
+        action="store_true",
+        help="Hardlink images instead of copying when source and target are on the same volume (use with -c)"
+    )
 
     args = parser.parse_args()
 
     try:
         if args.copy:
-            sys.exit(copy_mode_main(process_all=args.all, convert_mdx=args.convert, start_from=args.start_from))
+            sys.exit(copy_mode_main(process_all=args.all, convert_mdx=args.convert, start_from=args.start_from,
+                                    allow_hardlink=args.allow_hardlink))
         else:
             # Check if running on Windows in imaging mode (not supported)
             if IS_WINDOWS: